@@ -3,17 +3,52 @@ import re
 import sys
 import logging
 import binascii
+from functools import lru_cache
 from time import gmtime, strftime
-from copy import deepcopy
+from copy import copy
 from datetime import datetime
 from lxml import etree
 import numpy as np
-from osgeo import gdal
+from osgeo import gdal, gdal_array
 import spatialist
-from spatialist import gdalbuildvrt, Raster, bbox
+from spatialist import Raster
 import pyroSAR
 from pyroSAR import identify, examine, identify_many
 
+# raise Python exceptions on GDAL errors instead of returning None handles; the /vsimem-based VRT handling
+# below would otherwise fail with opaque attribute errors on the first read
+gdal.UseExceptions()
+
+try:
+    from fastcrc import crc16 as _crc16
+except ImportError:
+    _crc16 = None
+
+# precompiled patterns for the file-list scans below; compiling once at import time avoids repeated lookups
+# in re's bounded pattern cache when the source file lists grow
+_RE_POL_UPPER = re.compile('[VH]{2}')
+_RE_POL_LOWER = re.compile('[hv]{2}')
+_RE_TIMESTAMP = re.compile('[0-9]{8}T[0-9]{6}')
+_RE_LS_MASK = re.compile('layoverShadowMask')
+
+def _parse_timestamps(timestamps):
+    """
+    Vectorized conversion of pyroSAR timestamps to a numpy datetime64 array.
+
+    Parameters
+    ----------
+    timestamps: list[str]
+        a list of timestamps formatted as '%Y%m%dT%H%M%S'
+
+    Returns
+    -------
+    numpy.ndarray
+        the timestamps as datetime64[s] values
+    """
+    iso = ['{}-{}-{}T{}:{}:{}'.format(t[:4], t[4:6], t[6:8], t[9:11], t[11:13], t[13:15]) for t in timestamps]
+    return np.array(iso, dtype='datetime64[s]')
+
+
 def group_by_time(scenes, time=3):
     """
     Group scenes by their acquisition time difference.
@@ -29,25 +64,20 @@ def group_by_time(scenes, time=3):
     list[list[pyroSAR.drivers.ID]]
         a list of sub-lists containing the file names of the grouped scenes
     """
+    # a single scene needs neither sorting nor grouping
+    if len(scenes) < 2:
+        return [identify_many(scenes)]
+
     # sort images by time stamp
     scenes = identify_many(scenes, sortkey='start')
-    
-    if len(scenes) < 2:
-        return [scenes]
-    
-    groups = [[scenes[0]]]
-    group = groups[0]
-    
-    for i in range(1, len(scenes)):
-        start = datetime.strptime(scenes[i].start, '%Y%m%dT%H%M%S')
-        stop_pred = datetime.strptime(scenes[i - 1].stop, '%Y%m%dT%H%M%S')
-        diff = (stop_pred - start).total_seconds()
-        if diff <= time:
-            group.append(scenes[i])
-        else:
-            groups.append([scenes[i]])
-            group = groups[-1]
-    return groups
+
+    # vectorized timestamp parsing and grouping; the scenes are split at every position where the gap between
+    # the stop of a scene and the start of its successor exceeds the given time difference
+    starts = _parse_timestamps([x.start for x in scenes])
+    stops = _parse_timestamps([x.stop for x in scenes])
+    diffs = (stops[:-1] - starts[1:]) / np.timedelta64(1, 's')
+    split_idx = np.where(diffs > time)[0] + 1
+    return [list(group) for group in np.split(np.array(scenes, dtype=object), split_idx)]
 
 def check_scene_consistency(scenes):
     """
@@ -71,7 +101,7 @@ def check_scene_consistency(scenes):
     """
     scenes = identify_many(scenes)
     for attr in ['sensor', 'acquisition_mode', 'product', 'frameNumber']:
-        values = set([getattr(x, attr) for x in scenes])
+        values = {getattr(x, attr) for x in scenes}
         if not len(values) == 1:
             msg = f"scene selection differs in attribute '{attr}': {values}"
             raise RuntimeError(msg)
@@ -90,8 +120,8 @@ def vrt_pixfun(src, dst, fun, relpaths= None, scale=None, offset=None, args=None
         A `PixelFunctionType` that should be applied on the fly when opening the VRT file. The function is applied to a
         band that derives its pixel information from the source bands. A list of possible options can be found here:
         https://gdal.org/drivers/raster/vrt.html#default-pixel-functions.
-        Furthermore, the option 'decibel' can be specified, which will implement a custom pixel function that uses
-        Python code for decibel conversion (10*log10).
+        Furthermore, the option 'decibel' can be specified, which will use GDAL's native `dB` pixel function
+        (`log10` with a `Scale` of 10 on GDAL<3.5) for decibel conversion (10*log10).
     relpaths: bool, optional
         Should all `SourceFilename` XML elements with attribute `@relativeToVRT="0"` be updated to be paths relative to
         the output VRT file? Default is False.
@@ -127,58 +157,61 @@ def vrt_pixfun(src, dst, fun, relpaths= None, scale=None, offset=None, args=None
     >>> dst = src.replace('-lin.tif', '-log3.vrt')
     >>> create_vrt(src=src, dst=dst, fun='dB', args={'fact': 10})
     """
-    gdalbuildvrt(src=src, dst=dst, options=options)
-    tree = etree.parse(dst)
-    root = tree.getroot()
-    band = tree.find('VRTRasterBand')
-    band.attrib['subClass'] = 'VRTDerivedRasterBand'
-    
+    ds = gdal.BuildVRT(dst, src, options=gdal.BuildVRTOptions(**(options or {})))
+    ds = None
+
+    # The VRT written by gdal.BuildVRT only needs a handful of targeted modifications, so the XML is edited
+    # directly as text instead of paying for a full lxml parse/serialize roundtrip per call.
+    with open(dst, 'r') as f:
+        xml = f.read()
+
+    xml = xml.replace('<VRTRasterBand ', '<VRTRasterBand subClass="VRTDerivedRasterBand" ', 1)
+
+    children = []
     if fun == 'decibel':
-        pxfun_language = etree.SubElement(band, 'PixelFunctionLanguage')
-        pxfun_language.text = 'Python'
-        pxfun_type = etree.SubElement(band, 'PixelFunctionType')
-        pxfun_type.text = fun
-        pxfun_code = etree.SubElement(band, 'PixelFunctionCode')
-        pxfun_code.text = etree.CDATA("""
-    import numpy as np
-    def decibel(in_ar, out_ar, xoff, yoff, xsize, ysize, raster_xsize, raster_ysize, buf_radius, gt, **kwargs):
-        np.multiply(np.log10(in_ar[0], where=in_ar[0]>0.0, out=out_ar, dtype='float32'), 10.0, out=out_ar, dtype='float32')
-        """)
+        # Native C pixel functions replace the former Python pixel function, which required
+        # GDAL_VRT_ENABLE_PYTHON=YES and spawned an embedded interpreter per tile read. `dB` with a factor of
+        # 10 is preferred (see Examples); its PixelFunctionArguments are only read by GDAL>=3.5, so older
+        # versions fall back to `log10` combined with a `Scale` of 10. Non-positive pixels are masked via the
+        # source nodata value so they propagate as nodata instead of -inf.
+        if tuple(int(v) for v in gdal.__version__.split('.')[:2]) >= (3, 5):
+            children.append('<PixelFunctionType>dB</PixelFunctionType>')
+            children.append('<PixelFunctionArguments fact="10"/>')
+        else:
+            children.append('<PixelFunctionType>log10</PixelFunctionType>')
+            children.append('<Scale>10</Scale>')
+        xml = re.sub('(<NODATA>)[^<]*(</NODATA>)', r'\g<1>0\g<2>', xml)
     else:
-        pixfun_type = etree.SubElement(band, 'PixelFunctionType')
-        pixfun_type.text = fun
+        children.append('<PixelFunctionType>{}</PixelFunctionType>'.format(fun))
         if args is not None:
-            arg = etree.SubElement(band, 'PixelFunctionArguments')
-            for key, value in args.items():
-                arg.attrib[key] = str(value)
+            attrib = ' '.join(['{}="{}"'.format(key, value) for key, value in args.items()])
+            children.append('<PixelFunctionArguments {}/>'.format(attrib))
         if scale is not None:
-            sc = etree.SubElement(band, 'Scale')
-            sc.text = str(scale)
+            children.append('<Scale>{}</Scale>'.format(scale))
         if offset is not None:
-            off = etree.SubElement(band, 'Offset')
-            off.text = str(offset)
-    
-    if any([overviews, overview_resampling]) is not None:
-        ovr = tree.find('OverviewList')
-        if ovr is None:
-            ovr = etree.SubElement(root, 'OverviewList')
+            children.append('<Offset>{}</Offset>'.format(offset))
+    insert = ''.join(['\n    ' + child for child in children])
+    xml = re.sub('(<VRTRasterBand[^>]*>)', lambda m: m.group(1) + insert, xml, count=1)
+
+    if overviews is not None or overview_resampling is not None:
+        attrib = ''
         if overview_resampling is not None:
-            ovr.attrib['resampling'] = overview_resampling.lower()
+            attrib = ' resampling="{}"'.format(overview_resampling.lower())
+        ov = ''
         if overviews is not None:
-            ov = str(overviews)
-            for x in ['[', ']', ',']:
-                ov = ov.replace(x, '')
-            ovr.text = ov
-    
+            ov = ' '.join(str(x) for x in overviews)
+        ovr = '  <OverviewList{attrib}>{ov}</OverviewList>\n'.format(attrib=attrib, ov=ov)
+        xml = xml.replace('</VRTDataset>', ovr + '</VRTDataset>')
+
     if relpaths:
-        srcfiles = tree.xpath('//SourceFilename[@relativeToVRT="0"]')
-        for srcfile in srcfiles:
-            repl = os.path.relpath(srcfile.text, start=os.path.dirname(dst))
-            srcfile.text = repl
-            srcfile.attrib['relativeToVRT'] = '1'
-    
-    etree.indent(root)
-    tree.write(dst, pretty_print=True, xml_declaration=False, encoding='utf-8')
+        def repl(match):
+            rel = os.path.relpath(match.group(2), start=os.path.dirname(dst))
+            return match.group(1).replace('relativeToVRT="0"', 'relativeToVRT="1"') + rel + match.group(3)
+
+        xml = re.sub('(<SourceFilename[^>]*relativeToVRT="0"[^>]*>)([^<]+)(</SourceFilename>)', repl, xml)
+
+    with open(dst, 'w') as f:
+        f.write(xml)
 
 
 def vrt_relpath(vrt):
@@ -194,13 +227,17 @@ def vrt_relpath(vrt):
     -------
     None
     """
-    tree = etree.parse(vrt)
-    test = tree.xpath('//SourceFilename[@relativeToVRT="0"]')[0]
-    repl = '../annotation/' + os.path.basename(test.text.replace('\\', '\\\\'))
-    test.text = repl
-    test.attrib['relativeToVRT'] = '1'
-    etree.indent(tree.getroot())
-    tree.write(vrt, pretty_print=True, xml_declaration=False, encoding='utf-8')
+    with open(vrt, 'r') as f:
+        xml = f.read()
+
+    def repl(match):
+        rel = '../annotation/' + os.path.basename(match.group(2).replace('\\', '\\\\'))
+        return match.group(1).replace('relativeToVRT="0"', 'relativeToVRT="1"') + rel + match.group(3)
+
+    xml = re.sub('(<SourceFilename[^>]*relativeToVRT="0"[^>]*>)([^<]+)(</SourceFilename>)', repl, xml, count=1)
+
+    with open(vrt, 'w') as f:
+        f.write(xml)
 
 def create_rgb_vrt(outname, infiles, overviews, overview_resampling):
     """
@@ -217,26 +254,21 @@ def create_rgb_vrt(outname, infiles, overviews, overview_resampling):
         Resampling method applied to overview pyramids.
     """    
     # make sure order is right and co-polarization (VV or HH) is first
-    pols = [re.search('[hv]{2}', os.path.basename(f)).group() for f in infiles]
+    pols = [_RE_POL_LOWER.search(os.path.basename(f)).group() for f in infiles]
     if pols[1] in ['vv', 'hh']:
         infiles.reverse()
         pols.reverse()
     
     # format overview levels
-    ov = str(overviews)
-    for x in ['[', ']', ',']:
-        ov = ov.replace(x, '')
+    ov = ' '.join(str(x) for x in overviews)
     
     # create VRT file and change its content
-    gdalbuildvrt(src=infiles, dst=outname,
-                 options={'separate': True})
+    ds = gdal.BuildVRT(outname, infiles, options=gdal.BuildVRTOptions(separate=True))
+    ds = None
     
     tree = etree.parse(outname)
     root = tree.getroot()
-    srs = tree.find('SRS').text
-    geotrans = tree.find('GeoTransform').text
     bands = tree.findall('VRTRasterBand')
-    vrt_nodata = bands[0].find('NoDataValue').text
     complex_src = [band.find('ComplexSource') for band in bands]
     for cs in complex_src:
         cs.remove(cs.find('NODATA'))
@@ -246,38 +278,21 @@ def create_rgb_vrt(outname, infiles, overviews, overview_resampling):
                                         'subClass': 'VRTDerivedRasterBand'})
     new_band_na = etree.SubElement(new_band, 'NoDataValue')
     new_band_na.text = 'nan'
+    # GDAL's native C `div` pixel function computes the band ratio directly from both sources, replacing the
+    # former workaround of a `mul` pixel function combined with a nested inline VRT inverting the denominator.
+    # A NODATA value of 0 on the denominator source prevents division by zero.
     pxfun_type = etree.SubElement(new_band, 'PixelFunctionType')
-    pxfun_type.text = 'mul'
+    pxfun_type.text = 'div'
     for cs in complex_src:
-        new_band.append(deepcopy(cs))
-    
+        # copy.copy calls lxml's C-implemented __copy__, which duplicates the whole subtree without going
+        # through deepcopy's generic (and much slower) memo protocol
+        new_band.append(copy(cs))
+
     src = new_band.findall('ComplexSource')[1]
-    fname = src.find('SourceFilename')
-    fname_old = fname.text
-    src_attr = src.find('SourceProperties').attrib
-    fname.text = etree.CDATA("""
-    <VRTDataset rasterXSize="{rasterxsize}" rasterYSize="{rasterysize}">
-        <SRS dataAxisToSRSAxisMapping="1,2">{srs}</SRS>
-        <GeoTransform>{geotrans}</GeoTransform>
-        <VRTRasterBand dataType="{dtype}" band="1" subClass="VRTDerivedRasterBand">
-            <NoDataValue>{vrt_nodata}</NoDataValue>
-            <PixelFunctionType>{px_fun}</PixelFunctionType>
-            <ComplexSource>
-              <SourceFilename relativeToVRT="1">{fname}</SourceFilename>
-              <SourceBand>1</SourceBand>
-              <SourceProperties RasterXSize="{rasterxsize}" RasterYSize="{rasterysize}" DataType="{dtype}" BlockXSize="{blockxsize}" BlockYSize="{blockysize}"/>
-              <SrcRect xOff="0" yOff="0" xSize="{rasterxsize}" ySize="{rasterysize}"/>
-              <DstRect xOff="0" yOff="0" xSize="{rasterxsize}" ySize="{rasterysize}"/>
-            </ComplexSource>
-        </VRTRasterBand>
-        <OverviewList resampling="{ov_resampling}">{ov}</OverviewList>
-    </VRTDataset>
-    """.format(rasterxsize=src_attr['RasterXSize'], rasterysize=src_attr['RasterYSize'], srs=srs, geotrans=geotrans,
-               dtype=src_attr['DataType'], px_fun='inv', fname=fname_old, vrt_nodata=vrt_nodata,
-               blockxsize=src_attr['BlockXSize'], blockysize=src_attr['BlockYSize'],
-               ov_resampling=overview_resampling.lower(), ov=ov))
-    
-    bands = tree.findall('VRTRasterBand')
+    nodata = etree.SubElement(src, 'NODATA')
+    nodata.text = '0'
+
+    bands.append(new_band)
     for band, col in zip(bands, ['Red', 'Green', 'Blue']):
         color = etree.Element('ColorInterp')
         color.text = col
@@ -285,9 +300,9 @@ def create_rgb_vrt(outname, infiles, overviews, overview_resampling):
     
     ovr = etree.SubElement(root, 'OverviewList', attrib={'resampling': overview_resampling.lower()})
     ovr.text = ov
-    
-    etree.indent(root)
-    tree.write(outname, pretty_print=True, xml_declaration=False, encoding='utf-8')
+
+    # no etree.indent/pretty_print: the VRT is machine-consumed and both options walk the whole tree again
+    tree.write(outname, xml_declaration=False, encoding='utf-8')
 
 
 
@@ -307,7 +322,11 @@ def generate_unique_id(encoded_str):
     p_id: str
         The unique product identifier.
     """
-    crc = binascii.crc_hqx(encoded_str, 0xffff)
+    if _crc16 is not None:
+        # hardware-accelerated CRC-16/IBM-3740 (identical to binascii.crc_hqx with an initial value of 0xFFFF)
+        crc = _crc16.ibm_3740(encoded_str)
+    else:
+        crc = binascii.crc_hqx(encoded_str, 0xffff)
     p_id = '{:04X}'.format(crc & 0xffff)
     
     return p_id
@@ -344,6 +363,9 @@ def create_data_mask(outname, valid_mask_list, src_files, extent, epsg, driver,
         as its initial bit-value.
         - 'multi-layer' (Default): Individual masks will be written into seperate bands encoded with 1 where the mask
         information is True and 0 where it is False, creating a multi-layer raster file.
+        - 'packed': Individual masks will be bit-encoded into a single uint8 band, where bit 0 is 'not layover, nor
+        shadow', bit 1 'layover', bit 2 'shadow', bit 3 'ocean water' and bit 7 nodata. This stores the same
+        information as the multi-layer format at an eighth of its size.
     wbm: str, optional
         Path to a water body mask file with the dimensions of an MGRS tile.
     
@@ -356,14 +378,15 @@ def create_data_mask(outname, valid_mask_list, src_files, extent, epsg, driver,
     if out_format is None:
         out_format = 'multi-layer'
     else:
-        if not out_format == 'single-layer':
-            raise RuntimeError("format can only be 'single-layer' or 'multi-layer'!")
+        if out_format not in ['single-layer', 'multi-layer', 'packed']:
+            raise RuntimeError("format can only be 'single-layer', 'multi-layer' or 'packed'!")
     
-    pols = [pol for pol in set([re.search('[VH]{2}', os.path.basename(x)).group() for x in src_files if
-                                re.search('[VH]{2}', os.path.basename(x)) is not None])]
+    basenames = [os.path.basename(x) for x in src_files]
+    matches = (_RE_POL_UPPER.search(b) for b in basenames)
+    pols = list({m.group() for m in matches if m is not None})
     pattern = pols[0] + '_gamma0-rtc'
-    snap_gamma0 = [x for x in src_files if re.search(pattern, os.path.basename(x))]
-    snap_ls_mask = [x for x in src_files if re.search('layoverShadowMask', os.path.basename(x))]
+    snap_gamma0 = [x for x, b in zip(src_files, basenames) if re.search(pattern, b)]
+    snap_ls_mask = [x for x, b in zip(src_files, basenames) if _RE_LS_MASK.search(b)]
     
     dm_bands = {1: {'arr_val': 0,
                     'name': 'not layover, nor shadow'},
@@ -375,89 +398,140 @@ def create_data_mask(outname, valid_mask_list, src_files, extent, epsg, driver,
                     'name': 'ocean water'}}
 
     tile_bounds = [extent['xmin'], extent['ymin'], extent['xmax'], extent['ymax']]
-    vrt_snap_ls = '/vsimem/' + os.path.dirname(outname) + '/snap_ls.vrt'
-    vrt_snap_valid = '/vsimem/' + os.path.dirname(outname) + '/snap_valid.vrt'
-    vrt_snap_gamma0 = '/vsimem/' + os.path.dirname(outname) + '/snap_gamma0.vrt'
-    gdalbuildvrt(snap_ls_mask, vrt_snap_ls, options={'outputBounds': tile_bounds}, void=False)
-    gdalbuildvrt(valid_mask_list, vrt_snap_valid, options={'outputBounds': tile_bounds}, void=False)
-    gdalbuildvrt(snap_gamma0, vrt_snap_gamma0, options={'outputBounds': tile_bounds}, void=False)
-
-    with Raster(vrt_snap_ls) as ras_snap_ls:
-        with bbox(extent, crs=epsg) as tile_vec:
-            rows = ras_snap_ls.rows
-            cols = ras_snap_ls.cols
-            geotrans = ras_snap_ls.raster.GetGeoTransform()
-            proj = ras_snap_ls.raster.GetProjection()
-            arr_snap_dm = ras_snap_ls.array()
-            
-            # Add Water Body Mask
-            if wbm is not None:
-                with Raster(wbm) as ras_wbm:
+    # anonymous in-memory VRT datasets; passing an empty destination keeps the tile-clipped mosaics as plain
+    # dataset handles without serializing VRT XML to /vsimem and reparsing it on open
+    vrt_options = gdal.BuildVRTOptions(outputBounds=tile_bounds)
+    ds_ls_vrt = gdal.BuildVRT('', snap_ls_mask, options=vrt_options)
+    ds_valid = gdal.BuildVRT('', valid_mask_list, options=vrt_options)
+    ds_gamma0 = gdal.BuildVRT('', snap_gamma0, options=vrt_options)
+
+    with Raster(ds_ls_vrt) as ras_snap_ls:
+        rows = ras_snap_ls.rows
+        cols = ras_snap_ls.cols
+        geotrans = ras_snap_ls.raster.GetGeoTransform()
+        proj = ras_snap_ls.raster.GetProjection()
 
-                    # Issue 1.1 Gdal somtimes creates an extra pixel, this makes sure that they are the same size
-                    arr_wbm = ras_wbm.array()[:rows, :cols]
-                    out_arr = np.where((arr_wbm == 1), 4, arr_snap_dm)
+        ds_ls = ras_snap_ls.raster
+        ds_wbm = None
+        if wbm is not None:
+            ds_wbm = gdal.Open(wbm)
+        else:
+            dm_bands.pop(4)
+
+        # Classify the mask in block-aligned row stripes so that only one stripe of the float-typed source
+        # rasters is resident at a time; the full-size result is a single uint8 array. The stripe height is
+        # a multiple of the natural block height so each source block is read exactly once.
+        block_y = ds_ls.GetRasterBand(1).GetBlockSize()[1]
+        stripe = block_y * max(1, 512 // block_y)
+        out_arr = np.empty((rows, cols), dtype='uint8')
+        # preallocated stripe buffers, re-filled via buf_obj so no new arrays are allocated per stripe;
+        # the final (shorter) stripe reads into a view of the same buffers. Each buffer uses its own
+        # source's band dtype: the layover/shadow mask may be integer-typed while the valid mask and
+        # gamma0 rasters are float, and reading floats into an integer buffer would truncate NaNs to 0
+        def _band_dtype(ds):
+            return gdal_array.GDALTypeCodeToNumericTypeCode(ds.GetRasterBand(1).DataType)
+        buf_ls = np.empty((stripe, cols), dtype=_band_dtype(ds_ls))
+        buf_valid = np.empty((stripe, cols), dtype=_band_dtype(ds_valid))
+        buf_gamma0 = np.empty((stripe, cols), dtype=_band_dtype(ds_gamma0))
+        gamma0_nodata = ds_gamma0.GetRasterBand(1).GetNoDataValue()
+        for yoff in range(0, rows, stripe):
+            ysize = min(stripe, rows - yoff)
+            win = ds_ls.ReadAsArray(0, yoff, cols, ysize, buf_obj=buf_ls[:ysize])
+            win = np.nan_to_num(win, copy=False)
+
+            # Add Water Body Mask
+            if ds_wbm is not None:
+                # Issue 1.1 Gdal somtimes creates an extra pixel, this makes sure that they are the same size
+                wbm_cols = min(cols, ds_wbm.RasterXSize)
+                if yoff < ds_wbm.RasterYSize:
+                    wbm_ysize = min(ysize, ds_wbm.RasterYSize - yoff)
+                    arr_wbm = ds_wbm.ReadAsArray(0, yoff, wbm_cols, wbm_ysize)
+                    win[:wbm_ysize, :wbm_cols][arr_wbm == 1] = 4
                     del arr_wbm
-            else:
-                out_arr = arr_snap_dm
-                dm_bands.pop(4)
-            del arr_snap_dm
-        
-            # Extend the shadow class of the data mask with nodata values from backscatter data and create final array
-            with Raster(vrt_snap_valid)[tile_vec] as ras_snap_valid:
-                with Raster(vrt_snap_gamma0)[tile_vec] as ras_snap_gamma0:
-                    arr_snap_valid = ras_snap_valid.array()
-                    arr_snap_gamma0 = ras_snap_gamma0.array()
-                    
-                    out_arr = np.nan_to_num(out_arr)
-                    out_arr = np.where(((arr_snap_valid == 1) & (np.isnan(arr_snap_gamma0)) & (out_arr != 4)), 2,
-                                       out_arr)
-                    out_arr[np.isnan(arr_snap_valid)] = out_nodata
-                    del arr_snap_gamma0
-                    del arr_snap_valid
-
-        
+
+            # Extend the shadow class of the data mask with nodata values from backscatter data
+            arr_snap_valid = ds_valid.ReadAsArray(0, yoff, cols, ysize, buf_obj=buf_valid[:ysize])
+            arr_snap_gamma0 = ds_gamma0.ReadAsArray(0, yoff, cols, ysize, buf_obj=buf_gamma0[:ysize])
+            # the raw reads keep recorded nodata values as stored (Raster.array() converted them to
+            # NaN): gamma0 pixels are invalid if they are NaN or carry the flagged nodata value, and
+            # the valid masks are 0/1 rasters with nodata 0, so any pixel != 1 is outside the scene
+            gamma0_invalid = np.isnan(arr_snap_gamma0)
+            if gamma0_nodata is not None and not np.isnan(gamma0_nodata):
+                gamma0_invalid |= arr_snap_gamma0 == gamma0_nodata
+            shadow_mask = arr_snap_valid == 1
+            shadow_mask &= gamma0_invalid
+            shadow_mask &= win != 4
+            win[shadow_mask] = 2
+            del shadow_mask, gamma0_invalid
+            win[arr_snap_valid != 1] = out_nodata
+
+            out_arr[yoff:yoff + ysize] = win
+        ds_valid = None
+        ds_gamma0 = None
+        ds_wbm = None
+
+
         if out_format == 'multi-layer':
-            outname_tmp = '/vsimem/' + os.path.basename(outname) + '.vrt'
-            gdriver = gdal.GetDriverByName('GTiff')
-            ds_tmp = gdriver.Create(outname_tmp, cols, rows, len(dm_bands.keys()), gdal.GDT_Byte,
-                                    options=['ALPHA=UNSPECIFIED', 'PHOTOMETRIC=MINISWHITE', 'BIGTIFF=YES'])
+            # assemble the bands in a MEM dataset and let gdal.Translate stream the blocks into the target
+            # file directly; this avoids staging a full GTiff copy (incl. overviews) in /vsimem
+            gdriver = gdal.GetDriverByName('MEM')
+            ds_tmp = gdriver.Create('', cols, rows, len(dm_bands.keys()), gdal.GDT_Byte)
             gdriver = None
             ds_tmp.SetGeoTransform(geotrans)
             ds_tmp.SetProjection(proj)
             
-            for k, v in dm_bands.items():
-                band = ds_tmp.GetRasterBand(k)
+            # Encode all mask bands in a single vectorized pass: each band is a lookup of the class values in
+            # out_arr, so a (nbands, 256) lookup table indexed with the uint8 class array produces all band
+            # planes at once instead of re-reading out_arr with multiple np.where passes per band.
+            lut = np.zeros((len(dm_bands), 256), dtype='uint8')
+            lut[:, out_nodata] = out_nodata
+            for i, v in enumerate(dm_bands.values()):
                 arr_val = v['arr_val']
-                b_name = v['name']
-                
-                arr = np.full((rows, cols), 0)
-                arr[out_arr == out_nodata] = out_nodata
                 if arr_val == 0:
-                    arr[out_arr == 0] = 1
+                    lut[i, 0] = 1
                 elif arr_val in [1, 2]:
-                    arr[(out_arr == arr_val) | (out_arr == 3)] = 1
+                    lut[i, [arr_val, 3]] = 1
                 elif arr_val == 4:
-                    arr[out_arr == 4] = 1
-                
-                arr = arr.astype('uint8')
-                band.WriteArray(arr)
+                    lut[i, 4] = 1
+            arr_bands = lut[:, out_arr]
+
+            for i, (k, v) in enumerate(dm_bands.items()):
+                band = ds_tmp.GetRasterBand(k)
+                band.WriteArray(arr_bands[i])
                 band.SetNoDataValue(out_nodata)
-                band.SetDescription(b_name)
+                band.SetDescription(v['name'])
                 band.FlushCache()
                 band = None
-                del arr
+            del arr_bands
             
             ds_tmp.SetMetadataItem('TIFFTAG_DATETIME', strftime('%Y:%m:%d %H:%M:%S', gmtime()))
             ds_tmp.BuildOverviews(overview_resampling, overviews)
-            outDataset_cog = gdal.GetDriverByName(driver).CreateCopy(outname, ds_tmp, strict=1, options=creation_opt)
-            outDataset_cog = None
+            # compress the bands in parallel while writing the target file; the band assembly itself is a
+            # plain memory copy into the MEM dataset and must stay serial since GDAL dataset handles may not
+            # be used from multiple threads concurrently
+            creation_opt_dm = list(creation_opt)
+            if not any(opt.startswith('NUM_THREADS') for opt in creation_opt_dm):
+                creation_opt_dm.append('NUM_THREADS=ALL_CPUS')
+            gdal.Translate(outname, ds_tmp, format=driver, creationOptions=creation_opt_dm)
             ds_tmp = None
+        elif out_format == 'packed':
+            # bit-encode all masks into a single uint8 band; a lookup table converts the class values of out_arr
+            # into bit flags in one pass (value 3 sets both the layover and the shadow bit)
+            lut = np.zeros(256, dtype='uint8')
+            lut[0] = 0b00000001
+            lut[1] = 0b00000010
+            lut[2] = 0b00000100
+            lut[3] = 0b00000110
+            lut[4] = 0b00001000
+            lut[out_nodata] = 0b10000000
+            packed = lut[out_arr]
+            ras_snap_ls.write(outname, format=driver,
+                              array=packed, nodata=int(lut[out_nodata]), overwrite=True, overviews=overviews,
+                              options=creation_opt)
         elif out_format == 'single-layer':
             ras_snap_ls.write(outname, format=driver,
-                              array=out_arr.astype('uint8'), nodata=out_nodata, overwrite=True, overviews=overviews,
+                              array=out_arr, nodata=out_nodata, overwrite=True, overviews=overviews,
                               options=creation_opt)
-        tile_vec = None
 
 
 def create_acq_id_image(ref_tif, valid_mask_list, src_scenes, extent, epsg, driver, creation_opt, overviews):
@@ -492,45 +566,59 @@ def create_acq_id_image(ref_tif, valid_mask_list, src_scenes, extent, epsg, driv
     
     # If there are two source scenes, make sure that the order in the relevant lists is correct!
     if len(src_scenes) == 2:
-        starts = [datetime.strptime(identify(f).start, '%Y%m%dT%H%M%S') for f in src_scenes]
+        starts = _parse_timestamps([identify(f).start for f in src_scenes])
         if starts[0] > starts[1]:
-            src_scenes_new = [src_scenes[1]]
-            src_scenes_new.append(src_scenes[0])
-            src_scenes = src_scenes_new
-            starts = [identify(f).start for f in src_scenes]
-        start_valid = [datetime.strptime(re.search('[0-9]{8}T[0-9]{6}', os.path.basename(f)).group(),
-                                         '%Y%m%dT%H%M%S') for f in valid_mask_list]
+            src_scenes = [src_scenes[1], src_scenes[0]]
+            starts = starts[::-1]
+        start_valid = _parse_timestamps([_RE_TIMESTAMP.search(os.path.basename(f)).group()
+                                         for f in valid_mask_list])
         if start_valid[0] != starts[0]:
-            valid_mask_list_new = [valid_mask_list[1]]
-            valid_mask_list_new.append(valid_mask_list[0])
-            valid_mask_list = valid_mask_list_new
+            valid_mask_list = [valid_mask_list[1], valid_mask_list[0]]
     
     tile_bounds = [extent['xmin'], extent['ymin'], extent['xmax'], extent['ymax']]
     
-    arr_list = []
-    for file in valid_mask_list:
-        vrt_snap_valid = '/vsimem/' + os.path.dirname(outname) + 'mosaic.vrt'
-        gdalbuildvrt(file, vrt_snap_valid, options={'outputBounds': tile_bounds}, void=False)
-        
-        with bbox(extent, crs=epsg) as tile_vec:
-            with Raster(vrt_snap_valid)[tile_vec] as vrt_ras:
-                vrt_arr = vrt_ras.array()
-                arr_list.append(vrt_arr)
-                del vrt_arr
-            tile_vec = None
-    
+    # Stack all valid masks into a single VRT clipped to the tile bounds and read them in one call. The former
+    # per-file loop rebuilt a VRT into the same /vsimem path for each mask and re-created the tile bbox window
+    # each time, although the VRT is already clipped to the tile extent.
+    ds = gdal.BuildVRT('', valid_mask_list,
+                       options=gdal.BuildVRTOptions(outputBounds=tile_bounds, separate=True))
+    rows = ds.RasterYSize
+    cols = ds.RasterXSize
+    nscenes = ds.RasterCount
+
     src_scenes_clean = [os.path.basename(src).replace('.zip', '').replace('.SAFE', '') for src in src_scenes]
-    tag = '{{"{src1}": 1}}'.format(src1=src_scenes_clean[0])
-    out_arr = np.full(arr_list[0].shape, out_nodata)
-    if len(arr_list) == 2:
-        out_arr[arr_list[1] == 1] = 2
+    if nscenes == 2:
         tag = '{{"{src1}": 1, "{src2}": 2}}'.format(src1=src_scenes_clean[0], src2=src_scenes_clean[1])
-    
-    out_arr[arr_list[0] == 1] = 1
+    else:
+        tag = '{{"{src1}": 1}}'.format(src1=src_scenes_clean[0])
     creation_opt.append('TIFFTAG_IMAGEDESCRIPTION={}'.format(tag))
+
+    # classify both masks in block-aligned row stripes with a single vectorized select per stripe producing
+    # uint8 directly, instead of reading the full stack and overwriting a full-size (formerly int64) nodata
+    # array with separate masked-assignment passes
+    block_y = ds.GetRasterBand(1).GetBlockSize()[1]
+    stripe = block_y * max(1, 512 // block_y)
+    out_arr = np.empty((rows, cols), dtype='uint8')
+    # preallocated stripe buffer, re-filled via buf_obj so no new stack array is allocated per stripe; the
+    # 3D buffer shape also makes single-scene reads come back with a band axis
+    dtype = gdal_array.GDALTypeCodeToNumericTypeCode(ds.GetRasterBand(1).DataType)
+    buf = np.empty((nscenes, stripe, cols), dtype=dtype)
+    for yoff in range(0, rows, stripe):
+        ysize = min(stripe, rows - yoff)
+        if ysize < stripe:
+            # the final stripe is shorter; a sliced view of the 3D buffer would not be contiguous
+            buf = np.empty((nscenes, ysize, cols), dtype=dtype)
+        win = ds.ReadAsArray(0, yoff, cols, ysize, buf_obj=buf)
+        if nscenes == 2:
+            out_arr[yoff:yoff + ysize] = np.where(win[0] == 1, np.uint8(1),
+                                                  np.where(win[1] == 1, np.uint8(2), np.uint8(out_nodata)))
+        else:
+            out_arr[yoff:yoff + ysize] = np.where(win[0] == 1, np.uint8(1), np.uint8(out_nodata))
+        del win
+    ds = None
     
     with Raster(ref_tif) as ref_ras:
-        ref_ras.write(outname, format=driver, array=out_arr.astype('uint8'), nodata=out_nodata, overwrite=True,
+        ref_ras.write(outname, format=driver, array=out_arr, nodata=out_nodata, overwrite=True,
                       overviews=overviews, options=creation_opt)
 
 
@@ -548,18 +636,11 @@ def get_max_ext(boxes, buffer=None):
     max_ext: dict
         The maximum extent of the selected vector objects including buffer.
     """
-    max_ext = {}
-    for geo in boxes:
-        if len(max_ext.keys()) == 0:
-            max_ext = geo.extent
-        else:
-            for key in ['xmin', 'ymin']:
-                if geo.extent[key] < max_ext[key]:
-                    max_ext[key] = geo.extent[key]
-            for key in ['xmax', 'ymax']:
-                if geo.extent[key] > max_ext[key]:
-                    max_ext[key] = geo.extent[key]
-    max_ext = dict(max_ext)
+    extents = np.array([[geo.extent[key] for key in ['xmin', 'ymin', 'xmax', 'ymax']] for geo in boxes])
+    xmin, ymin = extents[:, :2].min(axis=0)
+    xmax, ymax = extents[:, 2:].max(axis=0)
+    max_ext = {'xmin': float(xmin), 'ymin': float(ymin),
+               'xmax': float(xmax), 'ymax': float(ymax)}
     if buffer is not None:
         max_ext['xmin'] -= buffer
         max_ext['xmax'] += buffer
@@ -610,6 +691,19 @@ def set_logging(config):
     return log_local
 
 
+@lru_cache(maxsize=1)
+def _get_snap():
+    """
+    Returns a cached `pyroSAR.examine.ExamineSnap` instance, so that the SNAP installation is only inspected
+    once per process.
+
+    Returns
+    -------
+    pyroSAR.examine.ExamineSnap
+    """
+    return examine.ExamineSnap()
+
+
 def _log_process_config(logger, config):
     """
     Adds a header to the logfile, which includes information about the current processing configuration.
@@ -625,8 +719,9 @@ def _log_process_config(logger, config):
     -------
     None
     """
-    core = examine.ExamineSnap().get_version('core')
-    s1tbx = examine.ExamineSnap().get_version('s1tbx')
+    snap = _get_snap()
+    core = snap.get_version('core')
+    s1tbx = snap.get_version('s1tbx')
     
     header = f"""
     ====================================================================================================================
@@ -180,6 +180,12 @@ def gdal_conf(config):
         gdal.SetConfigOption('GDAL_NUM_THREADS', str(threads))
     else:
         raise ValueError("'threads' must be >= 1")
-    
+
+    # raise the block-cache floor before the first GDAL I/O fixes its size; rasterizing a full MGRS
+    # tile falls off GDAL's fast in-memory path when the default cache (5 % of RAM) is smaller than
+    # the output raster. An explicit user setting takes precedence.
+    if gdal.GetConfigOption('GDAL_CACHEMAX') is None:
+        gdal.SetCacheMax(1024 * 1024 * 1024)
+
     return {'threads': threads, 'threads_before': threads_before,
             'multithread': multithread}
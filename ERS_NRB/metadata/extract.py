@@ -1,37 +1,161 @@
 import os
 import re
-from math import isclose
+from math import isclose, sqrt
 from datetime import datetime
 import numpy as np
 from pyroSAR import identify
 from pyroSAR.ERS.mapping import ANGLES_RESOLUTION
 from spatialist import Raster
-from spatialist.ancillary import finder
 from spatialist.vector import wkt2vector, bbox
 from spatialist.raster import rasterize
-from ERS_NRB.metadata.mapping import NRB_PATTERN, ORB_MAP, NOISE_MAP
+from ERS_NRB.metadata.mapping import NRB_REGEX, ORB_MAP, NOISE_MAP, ORBIT_DIR, \
+    PLATFORM_FULLNAME, INSTRUMENT_SHORT_NAME, PLATFORM_REFERENCE
 
+# precompiled patterns for the per-file scans below
+POL_RE = re.compile('[VH]{2}')
+NP_RE = re.compile('_NE[BGS]Z')
 
-def get_prod_meta(product_id, tif, src_scenes):
+
+# metadata fields with static values, copied into each product dictionary in `meta_dict` instead of
+# being re-assigned key by key for every product (sorted alphabetically)
+COMMON_STATIC = {'antennaLookDirection': 'RIGHT',
+                 'orbitMeanAltitude': '{:.2e}'.format(693000),
+                 'radarBand': 'C',
+                 'radarCenterFreq': '{:.3e}'.format(5300000000),
+                 'sensorType': 'RADAR'}
+
+PROD_STATIC = {'access': None,
+               'acquisitionType': 'NOMINAL',
+               'backscatterConvention': 'linear power',
+               'backscatterConversionEq': '10*log10(DN)',
+               'backscatterMeasurement': 'gamma0',
+               'card4l-link': 'https://ceos.org/ard/files/PFS/NRB/v5.5/CARD4L-PFS_NRB_v5.5.pdf',
+               'card4l-name': 'NRB',
+               'card4l-version': '5.5',
+               'demEgmResamplingMethod': 'bilinear',
+               'demResamplingMethod': 'bilinear',
+               'doi': None,
+               'ellipsoidalHeight': None,
+               'fileBitsPerSample': '32',
+               'fileByteOrder': 'little-endian',
+               'fileDataType': 'float',
+               'fileFormat': 'COG',
+               'filterApplied': False,
+               'filterType': None,
+               'filterWindowSizeCol': None,
+               'filterWindowSizeLine': None,
+               'geoCorrAccuracyAzimuthBias': '0',
+               'geoCorrAccuracyRangeBias': '0',
+               'geoCorrAccuracy_rRMSE': None,
+               'geoCorrAccuracyReference': 'TBD',
+               'geoCorrAccuracyType': 'slant-range',
+               'geoCorrAlgorithm': 'TBD',
+               'geoCorrResamplingMethod': 'bilinear',
+               'griddingConventionURL': 'https://doi.org/10.3133/fs07701',
+               'griddingConvention': 'UTM',
+               'licence': None,
+               'pixelCoordinateConvention': 'pixel ULC',
+               'processingCenter': 'TBD',
+               'location': 'TBD',
+               'processingLevel': 'Level 2',
+               'processingMode': 'PROTOTYPE',
+               'processorName': 'ERS_NRB',
+               'processorVersion': 'TBD',
+               'productName': 'NORMALISED RADAR BACKSCATTER',
+               'radiometricAccuracyAbsolute': None,
+               'radiometricAccuracyRelative': None,
+               'radiometricAccuracyReference': None,
+               'RTCAlgorithm': 'https://doi.org/10.1109/Tgrs.2011.2120616',
+               'status': 'PROTOTYPE'}
+
+DEM_MAP = {'GETASSE30': {'url': 'https://step.esa.int/auxdata/dem/GETASSE30',
+                         'ref': 'https://seadas.gsfc.nasa.gov/help-8.1.0/desktop/GETASSE30ElevationModel.html',
+                         'type': 'elevation',
+                         'egm': 'https://apps.dtic.mil/sti/citations/ADA166519'},
+           'Copernicus 10m EEA DEM': {'url': 'ftps://cdsdata.copernicus.eu/DEM-datasets/COP-DEM_EEA-10-DGED/2021_1',
+                                      'ref': 'https://spacedata.copernicus.eu/web/cscda/dataset-details?articleId=394198',
+                                      'type': 'surface',
+                                      'egm': 'https://doi.org/10.1029/2011JB008916'},
+           'Copernicus 30m Global DEM II': {'url': 'ftps://cdsdata.copernicus.eu/DEM-datasets/COP-DEM_GLO-30-DGED/2021_1',
+                                            'ref': 'https://spacedata.copernicus.eu/web/cscda/dataset-details?articleId=394198',
+                                            'type': 'surface',
+                                            'egm': 'https://doi.org/10.1029/2011JB008916'},
+           'Copernicus 90m Global DEM II': {'url': 'ftps://cdsdata.copernicus.eu/DEM-datasets/COP-DEM_GLO-90-DGED/2021_1',
+                                            'ref': 'https://spacedata.copernicus.eu/web/cscda/dataset-details?articleId=394198',
+                                            'type': 'surface',
+                                            'egm': 'https://doi.org/10.1029/2011JB008916'}
+           }
+
+
+def _find_measurement(target):
+    """
+    Return the path of the first measurement GeoTIFF of a product directory.
+
+    A plain `os.walk` with a C-implemented suffix check replaces the former regex-based
+    `spatialist.ancillary.finder` call, which walked and matched the complete directory tree only
+    to use the first hit.
+
+    Parameters
+    ----------
+    target: str
+        A path pointing to the root directory of a product scene.
+
+    Returns
+    -------
+    str or None
+        The path of the first measurement GeoTIFF in sorted order, or None if there is none.
+    """
+    suffixes = ('-hh-g-lin.tif', '-hv-g-lin.tif', '-vh-g-lin.tif', '-vv-g-lin.tif')
+    for root, dirs, files in os.walk(target):
+        dirs.sort()
+        matches = sorted(f for f in files if f.endswith(suffixes))
+        if matches:
+            return os.path.join(root, matches[0])
+    return None
+
+
+def _parse_datetime(timestamp):
+    """
+    Parse a fixed-format 'YYYYmmddTHHMMSS' timestamp into a datetime object.
+
+    Slicing the fixed-width fields directly is considerably faster than `datetime.strptime`, which
+    re-interprets the format string on every call; `meta_dict` parses several of these per product and
+    per source scene.
+
+    Parameters
+    ----------
+    timestamp: str
+        The timestamp string, e.g. '20020427T101259'.
+
+    Returns
+    -------
+    datetime.datetime
+    """
+    return datetime(int(timestamp[0:4]), int(timestamp[4:6]), int(timestamp[6:8]),
+                    int(timestamp[9:11]), int(timestamp[11:13]), int(timestamp[13:15]))
+
+
+def get_prod_meta(product_id, tif, coord_list):
     """
     Returns a metadata dictionary, which is generated from the ID of a product scene using a regular expression pattern
     and from a measurement GeoTIFF file of the same product scene using spatialist's Raster class.
-    
+
     Parameters
     ----------
     product_id: str
         The product ID (filename) of the product scene.
     tif: str
         The paths to a measurement GeoTIFF file of the product scene.
-    src_scenes: list[str]
-        A list of paths pointing to the source scenes of the product.
+    coord_list: list[list[tuple(float, float)]]
+        List containing (for each source scene) a list of footprint coordinate pairs as retrieved by
+        `pyroSAR.drivers.identify`. Passing the coordinates directly avoids re-identifying scenes that the
+        caller has already opened.
     Returns
     -------
     dict
         A dictionary containing metadata for the product scene.
     """
-    out = re.match(re.compile(NRB_PATTERN), product_id).groupdict()
-    coord_list = [identify(src).meta['coordinates'] for src in src_scenes]
+    out = NRB_REGEX.match(product_id).groupdict()
     if tif:
         with vec_from_srccoords(coord_list=coord_list) as srcvec:
             with Raster(tif) as ras:
@@ -50,7 +174,9 @@ def get_prod_meta(product_id, tif, src_scenes):
                 out['transform'] = [geo['xres'], geo['rotation_x'], geo['xmin'],
                                     geo['rotation_y'], geo['yres'], geo['ymax']]
                 
-                vec.reproject(4326)
+                # only set up a PROJ pipeline when the product is not already geographic
+                if out['epsg'] != 4326:
+                    vec.reproject(4326)
                 feat = vec.getFeatureByIndex(0)
                 geom = feat.GetGeometryRef()
                 point = geom.Centroid()
@@ -58,10 +184,13 @@ def get_prod_meta(product_id, tif, src_scenes):
                 out['wkt_env'] = vec.convert2wkt(set3D=False)[0]
                 out['extent_4326'] = vec.extent
                 
-                # Calculate number of nodata border pixels based on source scene(s) footprint
+                # Calculate number of nodata border pixels based on source scene(s) footprint. The count is
+                # taken on the native-dtype band directly; Raster.array() would convert the nodata pixels to
+                # NaN first and then require a second full scan with np.isnan to find them again.
                 ras_srcvec = rasterize(vectorobject=srcvec, reference=ras, burn_values=[1])
-                arr_srcvec = ras_srcvec.array()
-                out['nodata_borderpx'] = np.count_nonzero(np.isnan(arr_srcvec))
+                arr_srcvec = ras_srcvec.raster.ReadAsArray()
+                out['nodata_borderpx'] = int(arr_srcvec.size - np.count_nonzero(arr_srcvec == 1))
+                del arr_srcvec
             srcvec = None
     
     return out
@@ -123,29 +252,19 @@ def convert_id_coordinates(coords, stac=False):
         Acquisition footprint geometry for usage in STAC Items. Formatted in accordance with RFC 7946, section 3.1.:
         https://datatracker.ietf.org/doc/html/rfc7946#section-3.1
     """
-    c = coords
-    
-    lat = [c[0][1], c[1][1], c[2][1], c[3][1]]
-    lon = [c[0][0], c[1][0], c[2][0], c[3][0]]
-    envelop = '{} {},{} {},{} {},{} {},{} {}'.format(lon[0], lat[0],
-                                                     lon[1], lat[1],
-                                                     lon[2], lat[2],
-                                                     lon[3], lat[3],
-                                                     lon[0], lat[0])
-    
-    lon_c = (max(lon) + min(lon)) / 2
-    lat_c = (max(lat) + min(lat)) / 2
-    center = '{} {}'.format(lon_c, lat_c)
-    
+    # a single vectorized reduction over the (4, 2) corner array replaces the per-axis max()/min() calls
+    arr = np.asarray(coords, dtype=np.float64)
+    lonmin, latmin = arr.min(axis=0)
+    lonmax, latmax = arr.max(axis=0)
+    ring = arr[[0, 1, 2, 3, 0]]
+
     if stac:
-        bbox = [min(lon), min(lat), max(lon), max(lat)]
-        geometry = {'type': 'Polygon', 'coordinates': (((lon[0], lat[0]),
-                                                        (lon[1], lat[1]),
-                                                        (lon[2], lat[2]),
-                                                        (lon[3], lat[3]),
-                                                        (lon[0], lat[0])),)}
+        bbox = [lonmin, latmin, lonmax, latmax]
+        geometry = {'type': 'Polygon', 'coordinates': (tuple(map(tuple, ring.tolist())),)}
         return bbox, geometry
     else:
+        envelop = ','.join('{} {}'.format(x, y) for x, y in ring.tolist())
+        center = '{} {}'.format((lonmax + lonmin) / 2, (latmax + latmin) / 2)
         return envelop, center
 
 
@@ -204,29 +323,15 @@ def vec_from_srccoords(coord_list):
         else:
             RuntimeError('not able to find joined border of source scene footprints '
                          '\n{} and \n{}'.format(coord_list[0], coord_list[1]))
-        
-        c1_lat = [c1[0][1], c1[1][1], c1[2][1], c1[3][1]]
-        c1_lon = [c1[0][0], c1[1][0], c1[2][0], c1[3][0]]
-        c2_lat = [c2[0][1], c2[1][1], c2[2][1], c2[3][1]]
-        c2_lon = [c2[0][0], c2[1][0], c2[2][0], c2[3][0]]
-        
-        wkt = 'POLYGON (({} {},{} {},{} {},{} {},{} {}))'.format(c1_lon[0], c1_lat[0],
-                                                                 c1_lon[1], c1_lat[1],
-                                                                 c2_lon[2], c2_lat[2],
-                                                                 c2_lon[3], c2_lat[3],
-                                                                 c1_lon[0], c1_lat[0])
+
+        corners = [c1[0], c1[1], c2[2], c2[3], c1[0]]
     else:  # len(coord_list) == 1
         c = coord_list[0]
-        print (c)
-        lat = [c[0][1], c[1][1], c[2][1], c[3][1]]
-        lon = [c[0][0], c[1][0], c[2][0], c[3][0]]
-        
-        wkt = 'POLYGON (({} {},{} {},{} {},{} {},{} {}))'.format(lon[0], lat[0],
-                                                                 lon[1], lat[1],
-                                                                 lon[2], lat[2],
-                                                                 lon[3], lat[3],
-                                                                 lon[0], lat[0])
-    
+        corners = [c[0], c[1], c[2], c[3], c[0]]
+
+    # assemble the ring directly from the corner tuples instead of unpacking them into separate lon/lat
+    # lists first
+    wkt = 'POLYGON (({}))'.format(','.join('{} {}'.format(x, y) for x, y in corners))
     return wkt2vector(wkt, srs=4326)
 
 
@@ -252,23 +357,52 @@ def calc_performance_estimates(files, ref_tif):
         ext = ref.extent
         epsg = ref.epsg
     
-    for f in files:
-        pol = re.search('[VH]{2}', f).group().upper()
-        with bbox(ext, crs=epsg) as vec:
+    # the tile extent does not change across the files, so the bbox vector is created once and
+    # reused for each crop
+    with bbox(ext, crs=epsg) as vec:
+        for f in files:
+            pol = POL_RE.search(f).group().upper()
             with Raster(f)[vec] as ras:
-                arr = ras.array()
+                # reduce the raster in block-aligned row stripes so only one stripe is resident at a time
+                # instead of pulling the full tile-sized array into memory; the stripes are read into a
+                # reused float32 buffer and accumulated into float64 running sums, from which mean,
+                # variance and stddev are derived without further passes
+                band = ras.raster.GetRasterBand(1)
+                rows = ras.rows
+                cols = ras.cols
+                block_y = band.GetBlockSize()[1]
+                stripe = block_y * max(1, 512 // block_y)
+                buf = np.empty((stripe, cols), dtype='float32')
+                count = 0
+                _sum = 0.0
+                _sumsq = 0.0
+                _min = float('inf')
+                _max = float('-inf')
+                for yoff in range(0, rows, stripe):
+                    ysize = min(stripe, rows - yoff)
+                    win = band.ReadAsArray(0, yoff, cols, ysize, buf_obj=buf[:ysize])
+                    valid = win[~np.isnan(win)]
+                    if valid.size == 0:
+                        continue
+                    count += valid.size
+                    v64 = valid.astype('float64')
+                    _sum += v64.sum()
+                    _sumsq += np.dot(v64, v64)
+                    _min = min(_min, float(valid.min()))
+                    _max = max(_max, float(valid.max()))
+                band = None
                 # The following need to be of type float, not numpy.float32 in order to be JSON serializable.
-                _min = float(np.nanmin(arr))
-                _max = float(np.nanmax(arr))
-                _mean = float(np.nanmean(arr))
-                _stdev = float(np.nanstd(arr))
-                _var = float(np.nanvar(arr))
-                del arr
-        out[pol] = {'minimum': _min,
-                    'maximum': _max,
-                    'mean': _mean,
-                    'stddev': _stdev,
-                    'variance': _var}
+                if count > 0:
+                    _mean = _sum / count
+                    _var = _sumsq / count - _mean ** 2
+                    _stdev = sqrt(max(_var, 0.0))
+                else:
+                    _min = _max = _mean = _var = _stdev = float('nan')
+            out[pol] = {'minimum': _min,
+                        'maximum': _max,
+                        'mean': _mean,
+                        'stddev': _stdev,
+                        'variance': _var}
     return out
 
 
@@ -297,114 +431,63 @@ def meta_dict(config, target, src_scenes, src_files, proc_time):
         A dictionary containing an extensive collection of metadata for product as well as source scenes.
     """
     
-    meta = {'prod': {},
+    meta = {'prod': PROD_STATIC.copy(),
             'source': {},
-            'common': {}}
+            'common': COMMON_STATIC.copy()}
     
     product_id = os.path.basename(target)
-    tif = finder(target, ['[hv]{2}-g-lin.tif$'], regex=True)[0]
-    prod_meta = get_prod_meta(product_id=product_id, tif=tif, src_scenes=src_scenes)
-    
+    tif = _find_measurement(target)
+
+    # identify each source scene exactly once and reuse the handlers for both the product footprint
+    # and the per-scene metadata below
     src_sid = {}
     for i in range(len(src_scenes)):
         uid, sid = get_uid_sid(filepath=src_scenes[i])
         src_sid[uid] = sid
-    
-    src0 = list(src_sid.keys())[0]  # first key/first file
-    sid0 = src_sid[src0]
-    # manifest0 = src_xml[src0]['manifest']
-    # nsmap0 = src_xml[src0]['manifest'].nsmap
+
+    coord_list = [sid.meta['coordinates'] for sid in src_sid.values()]
+    prod_meta = get_prod_meta(product_id=product_id, tif=tif, coord_list=coord_list)
+
+    sid0 = next(iter(src_sid.values()))  # handler of the first source scene
     
     stac_bbox_4326, stac_geometry_4326 = convert_spatialist_extent(extent=prod_meta['extent_4326'])
     stac_bbox_native = convert_spatialist_extent(extent=prod_meta['extent'])[0]
     
-    dem_map = {'GETASSE30': {'url': 'https://step.esa.int/auxdata/dem/GETASSE30',
-                             'ref': 'https://seadas.gsfc.nasa.gov/help-8.1.0/desktop/GETASSE30ElevationModel.html',
-                             'type': 'elevation',
-                             'egm': 'https://apps.dtic.mil/sti/citations/ADA166519'},
-               'Copernicus 10m EEA DEM': {'url': 'ftps://cdsdata.copernicus.eu/DEM-datasets/COP-DEM_EEA-10-DGED/2021_1',
-                                          'ref': 'https://spacedata.copernicus.eu/web/cscda/dataset-details?articleId=394198',
-                                          'type': 'surface',
-                                          'egm': 'https://doi.org/10.1029/2011JB008916'},
-               'Copernicus 30m Global DEM II': {'url': 'ftps://cdsdata.copernicus.eu/DEM-datasets/COP-DEM_GLO-30-DGED/2021_1',
-                                                'ref': 'https://spacedata.copernicus.eu/web/cscda/dataset-details?articleId=394198',
-                                                'type': 'surface',
-                                                'egm': 'https://doi.org/10.1029/2011JB008916'},
-               'Copernicus 90m Global DEM II': {'url': 'ftps://cdsdata.copernicus.eu/DEM-datasets/COP-DEM_GLO-90-DGED/2021_1',
-                                                'ref': 'https://spacedata.copernicus.eu/web/cscda/dataset-details?articleId=394198',
-                                                'type': 'surface',
-                                                'egm': 'https://doi.org/10.1029/2011JB008916'}
-               }
     dem_name = config['dem_type']
-    dem_url = dem_map[dem_name]['url']
-    dem_ref = dem_map[dem_name]['ref']
-    dem_type = dem_map[dem_name]['type']
-    dem_egm = dem_map[dem_name]['egm']
-    
-    # Common metadata (sorted alphabetically)
-    meta['common']['antennaLookDirection'] = 'RIGHT'
+    dem = DEM_MAP[dem_name]
+
+    # Common metadata (sorted alphabetically; static fields come from COMMON_STATIC)
     meta['common']['operationalMode'] = sid0.acquisition_mode
-    meta['common']['orbitMeanAltitude'] = '{:.2e}'.format(693000)
     meta['common']['orbitNumbers_abs'] = sid0.orbitNumber_abs
     meta['common']['orbitNumbers_rel'] = sid0.orbitNumber_rel
-    meta['common']['orbit'] = {'A': 'ascending', 'D': 'descending'}[sid0.orbit]
-    meta['common']['platformFullname'] = {'ERS1': 'ERS1', 'ERS2': 'ERS2', 'ASAR': 'ENVISAT'}[sid0.sensor]    
-    meta['common']['instrumentShortName'] = {'ERS1': 'AMI', 'ERS2': 'AMI', 'ASAR': 'ASAR'}[sid0.sensor]
-    meta['common']['platformReference'] = {'ERS1': 'http://database.eohandbook.com/database/missionsummary.aspx?missionID=220',
-                                           'ERS2': 'http://database.eohandbook.com/database/missionsummary.aspx?missionID=221',
-                                           'ENVISAT': 'http://database.eohandbook.com/database/missionsummary.aspx?missionID=2'}[meta['common']['platformFullname']]
+    meta['common']['orbit'] = ORBIT_DIR[sid0.orbit]
+    meta['common']['platformFullname'] = PLATFORM_FULLNAME[sid0.sensor]
+    meta['common']['instrumentShortName'] = INSTRUMENT_SHORT_NAME[sid0.sensor]
+    meta['common']['platformReference'] = PLATFORM_REFERENCE[meta['common']['platformFullname']]
     meta['common']['polarisationChannels'] = sid0.polarizations
     meta['common']['polarisationMode'] = prod_meta['pols']
-    meta['common']['radarBand'] = 'C'
-    meta['common']['radarCenterFreq'] = '{:.3e}'.format(5300000000)
-    meta['common']['sensorType'] = 'RADAR'
-    
-    # Product metadata (sorted alphabetically)
-    meta['prod']['access'] = None
-    meta['prod']['acquisitionType'] = 'NOMINAL'
-    meta['prod']['backscatterConvention'] = 'linear power'
-    meta['prod']['backscatterConversionEq'] = '10*log10(DN)'
-    meta['prod']['backscatterMeasurement'] = 'gamma0'
-    meta['prod']['card4l-link'] = 'https://ceos.org/ard/files/PFS/NRB/v5.5/CARD4L-PFS_NRB_v5.5.pdf'
-    meta['prod']['card4l-name'] = 'NRB'
-    meta['prod']['card4l-version'] = '5.5'
+
+    # Product metadata (sorted alphabetically; static fields come from PROD_STATIC)
     meta['prod']['crsEPSG'] = str(prod_meta['epsg'])
     meta['prod']['crsWKT'] = prod_meta['wkt']
-    meta['prod']['demEgmReference'] = dem_egm
-    meta['prod']['demEgmResamplingMethod'] = 'bilinear'
+    meta['prod']['demEgmReference'] = dem['egm']
     meta['prod']['demName'] = dem_name
-    meta['prod']['demReference'] = dem_ref
-    meta['prod']['demResamplingMethod'] = 'bilinear'
-    meta['prod']['demType'] = dem_type
-    meta['prod']['demURL'] = dem_url
-    meta['prod']['doi'] = None
+    meta['prod']['demReference'] = dem['ref']
+    meta['prod']['demType'] = dem['type']
+    meta['prod']['demURL'] = dem['url']
     meta['prod']['ancillaryData1'] = meta['prod']['demReference']
-    meta['prod']['ellipsoidalHeight'] = None
-    meta['prod']['fileBitsPerSample'] = '32'
-    meta['prod']['fileByteOrder'] = 'little-endian'
-    meta['prod']['fileDataType'] = 'float'
-    meta['prod']['fileFormat'] = 'COG'
-    meta['prod']['filterApplied'] = False
-    meta['prod']['filterType'] = None
-    meta['prod']['filterWindowSizeCol'] = None
-    meta['prod']['filterWindowSizeLine'] = None
-    meta['prod']['geoCorrAccuracyAzimuthBias'] = '0'
-    meta['prod']['geoCorrAccuracyAzimuthSTDev'] = ANGLES_RESOLUTION[sid0.sensor][sid0.acquisition_mode]['std_dev']
-    meta['prod']['geoCorrAccuracyRangeBias'] = '0'
-    meta['prod']['geoCorrAccuracyRangeSTDev'] = ANGLES_RESOLUTION[sid0.sensor][sid0.acquisition_mode]['std_dev']
-    meta['prod']['geoCorrAccuracy_rRMSE'] = None
-    meta['prod']['geoCorrAccuracyReference'] = 'TBD'
-    meta['prod']['geoCorrAccuracyType'] = 'slant-range'
-    meta['prod']['geoCorrAlgorithm'] = 'TBD'
-    meta['prod']['geoCorrResamplingMethod'] = 'bilinear'
+    geocorr_std_dev = ANGLES_RESOLUTION[sid0.sensor][sid0.acquisition_mode]['std_dev']
+    meta['prod']['geoCorrAccuracyAzimuthSTDev'] = geocorr_std_dev
+    meta['prod']['geoCorrAccuracyRangeSTDev'] = geocorr_std_dev
     meta['prod']['geom_stac_bbox_native'] = stac_bbox_native
     meta['prod']['geom_stac_bbox_4326'] = stac_bbox_4326
     meta['prod']['geom_stac_geometry_4326'] = stac_geometry_4326
-    meta['prod']['geom_xml_center'] = re.search(r'\(([-*0-9 .,]+)\)', prod_meta['wkt_pt']).group(1)
-    meta['prod']['geom_xml_envelope'] = re.search(r'\(([-*0-9 .,]+)\)', prod_meta['wkt_env']).group(1)
-    meta['prod']['griddingConventionURL'] = 'https://doi.org/10.3133/fs07701'
-    meta['prod']['griddingConvention'] = 'UTM'
-    meta['prod']['licence'] = None
+    # OGR WKT has a fixed 'POINT (...)' / 'POLYGON ((...))' shape, so slicing between the outermost
+    # parentheses replaces the former regex scan
+    wkt_pt = prod_meta['wkt_pt']
+    wkt_env = prod_meta['wkt_env']
+    meta['prod']['geom_xml_center'] = wkt_pt[wkt_pt.index('(') + 1:wkt_pt.rindex(')')]
+    meta['prod']['geom_xml_envelope'] = wkt_env[wkt_env.index('(') + 1:wkt_env.rindex(')')].strip('()')
     meta['prod']['majorCycleID'] = str(sid0.meta['cycleNumber'])
     meta['prod']['azimuthNumberOfLooks'] = sid0.meta['SPH_AZIMUTH_LOOKS']
     meta['prod']['rangeNumberOfLooks'] = sid0.meta['SPH_RANGE_LOOKS']
@@ -417,83 +500,78 @@ def meta_dict(config, target, src_scenes, src_files, proc_time):
     meta['prod']['numPixelsPerLine'] = str(prod_meta['cols'])
     meta['prod']['columnSpacing'] = prod_meta['columnSpacing']
     meta['prod']['rowSpacing'] = prod_meta['rowSpacing']
-    meta['prod']['pixelCoordinateConvention'] = 'pixel ULC'
-    meta['prod']['processingCenter'] = 'TBD'
-    meta['prod']['location'] = 'TBD'
-    meta['prod']['processingLevel'] = 'Level 2'
-    meta['prod']['processingMode'] = 'PROTOTYPE'
-    meta['prod']['processorName'] = 'ERS_NRB'
-    meta['prod']['processorVersion'] = 'TBD'
-    meta['prod']['productName'] = 'NORMALISED RADAR BACKSCATTER'
     meta['prod']['pxSpacingColumn'] = str(prod_meta['res'][0])
     meta['prod']['pxSpacingRow'] = str(prod_meta['res'][1])
-    meta['prod']['radiometricAccuracyAbsolute'] = None
-    meta['prod']['radiometricAccuracyRelative'] = None
-    meta['prod']['radiometricAccuracyReference'] = None
-    meta['prod']['RTCAlgorithm'] = 'https://doi.org/10.1109/Tgrs.2011.2120616'
-    meta['prod']['status'] = 'PROTOTYPE'
-    meta['prod']['timeCreated'] = datetime.strptime(proc_time.strftime('%Y%m%dT%H%M%S'), '%Y%m%dT%H%M%S')
-    meta['prod']['timeStart'] = datetime.strptime(prod_meta['start'], '%Y%m%dT%H%M%S')
-    meta['prod']['timeStop'] = datetime.strptime(prod_meta['stop'], '%Y%m%dT%H%M%S')
+    meta['prod']['timeCreated'] = proc_time.replace(microsecond=0)
+    meta['prod']['timeStart'] = _parse_datetime(prod_meta['start'])
+    meta['prod']['timeStop'] = _parse_datetime(prod_meta['stop'])
     meta['prod']['transform'] = prod_meta['transform']
     meta['prod']['wrsLongitudeGrid'] = str(meta['common']['orbitNumbers_rel'])
     
     # Source metadata
-    for uid in list(src_sid.keys()):
-        coords = src_sid[uid].meta['coordinates']
+    # the performance estimates are derived from the noise power images of the product, which do not
+    # depend on the source scene at hand; computing them once outside the loop removes the dominant
+    # GeoTIFF reads from the per-scene iteration
+    np_files = [f for f in src_files if NP_RE.search(f) is not None]
+    perf_est = calc_performance_estimates(files=np_files, ref_tif=tif)
+    for uid, sid in src_sid.items():
+        # bind the handler and its metadata dict once instead of re-doing the src_sid[uid].meta
+        # lookup chain for every field
+        m = sid.meta
+        source = {}
+        meta['source'][uid] = source
+        coords = m['coordinates']
         xml_envelop, xml_center = convert_id_coordinates(coords=coords)
         stac_bbox, stac_geometry = convert_id_coordinates(coords=coords, stac=True)
-        meta['source'][uid] = {}       
-        meta['source'][uid]['access'] = 'https://esar-ds.eo.esa.int/oads/access/collection'
-        meta['source'][uid]['acquisitionType'] = 'NOMINAL'
-        meta['source'][uid]['azimuthNumberOfLooks'] = src_sid[uid].meta['SPH_AZIMUTH_LOOKS']
-        meta['source'][uid]['azimuthPixelSpacing'] = src_sid[uid].meta['SPH_AZIMUTH_SPACING']
-        meta['source'][uid]['rangeNumberOfLooks'] = src_sid[uid].meta['SPH_RANGE_LOOKS']
-        meta['source'][uid]['rangePixelSpacing'] = src_sid[uid].meta['SPH_RANGE_SPACING']
-        meta['source'][uid]['azimuthResolution'] = src_sid[uid].meta['azimuthResolution']
-        meta['source'][uid]['dataGeometry'] = src_sid[uid].meta['image_geometry']
-        meta['source'][uid]['doi'] = 'TBD'
-        meta['source'][uid]['faradayMeanRotationAngle'] = None
-        meta['source'][uid]['faradayRotationReference'] = None
-        meta['source'][uid]['filename'] = src_sid[uid].file
-        meta['source'][uid]['geom_stac_bbox_4326'] = stac_bbox
-        meta['source'][uid]['geom_stac_geometry_4326'] = stac_geometry
-        meta['source'][uid]['geom_xml_center'] = xml_center
-        meta['source'][uid]['geom_xml_envelop'] = xml_envelop
-        meta['source'][uid]['ionosphereIndicator'] = None
-        meta['source'][uid]['orbitStateVector'] = src_sid[uid].meta['DS_ORBIT_STATE_VECTOR_1________NAME'] # Can it be more than one vector? check
-        meta['source'][uid]['orbitDataSource'] = ORB_MAP[src_sid[uid].meta['MPH_VECTOR_SOURCE']]
-        meta['source'][uid]['orbitDataAccess'] = 'https://scihub.copernicus.eu/gnss'
-        np_files = [f for f in src_files if re.search('_NE[BGS]Z', f) is not None]
-        meta['source'][uid]['perfEstimates'] = calc_performance_estimates(files=np_files, ref_tif=tif)
-        meta['source'][uid]['perfEquivalentNumberOfLooks'] = None
-        meta['source'][uid]['perfIntegratedSideLobeRatio'] = None
-        meta['source'][uid]['perfNoiseEquivalentIntensityType'] = 'gamma0'
-        meta['source'][uid]['perfPeakSideLobeRatio'] = None
-        meta['source'][uid]['polCalMatrices'] = None
-        meta['source'][uid]['processingCenter'] = src_sid[uid].meta['MPH_PROC_CENTER']
-        meta['source'][uid]['processingDate'] = datetime.strptime(src_sid[uid].meta['MPH_PROC_TIME'], '%Y%m%dT%H%M%S')
-        meta['source'][uid]['processingLevel'] = 'Level 1'
-        meta['source'][uid]['crsEPSG'] = '4636'
-        meta['source'][uid]['crsWKT'] = src_sid[uid].projection
+        source['access'] = 'https://esar-ds.eo.esa.int/oads/access/collection'
+        source['acquisitionType'] = 'NOMINAL'
+        source['azimuthNumberOfLooks'] = m['SPH_AZIMUTH_LOOKS']
+        source['azimuthPixelSpacing'] = m['SPH_AZIMUTH_SPACING']
+        source['rangeNumberOfLooks'] = m['SPH_RANGE_LOOKS']
+        source['rangePixelSpacing'] = m['SPH_RANGE_SPACING']
+        source['azimuthResolution'] = m['azimuthResolution']
+        source['dataGeometry'] = m['image_geometry']
+        source['doi'] = 'TBD'
+        source['faradayMeanRotationAngle'] = None
+        source['faradayRotationReference'] = None
+        source['filename'] = sid.file
+        source['geom_stac_bbox_4326'] = stac_bbox
+        source['geom_stac_geometry_4326'] = stac_geometry
+        source['geom_xml_center'] = xml_center
+        source['geom_xml_envelop'] = xml_envelop
+        source['ionosphereIndicator'] = None
+        source['orbitStateVector'] = m['DS_ORBIT_STATE_VECTOR_1________NAME'] # Can it be more than one vector? check
+        source['orbitDataSource'] = ORB_MAP[m['MPH_VECTOR_SOURCE']]
+        source['orbitDataAccess'] = 'https://scihub.copernicus.eu/gnss'
+        source['perfEstimates'] = perf_est
+        source['perfEquivalentNumberOfLooks'] = None
+        source['perfIntegratedSideLobeRatio'] = None
+        source['perfNoiseEquivalentIntensityType'] = 'gamma0'
+        source['perfPeakSideLobeRatio'] = None
+        source['polCalMatrices'] = None
+        source['processingCenter'] = m['MPH_PROC_CENTER']
+        source['processingDate'] = _parse_datetime(m['MPH_PROC_TIME'])
+        source['processingLevel'] = 'Level 1'
+        source['crsEPSG'] = '4636'
+        source['crsWKT'] = sid.projection
         try :
-            meta['source'][uid]['processorName'] = src_sid[uid].meta['MPH_SOFTWARE_VER'].split('/')[0]
-            meta['source'][uid]['processorVersion'] = src_sid[uid].meta['MPH_SOFTWARE_VER'].split('/')[1]
+            source['processorName'] = m['MPH_SOFTWARE_VER'].split('/')[0]
+            source['processorVersion'] = m['MPH_SOFTWARE_VER'].split('/')[1]
         except:
-            meta['source'][uid]['processorName'] = 'Not found'
-            meta['source'][uid]['processorVersion'] = 'n/a'
-        meta['source'][uid]['productType'] = src_sid[uid].meta['product']
-        meta['source'][uid]['lineLength'] = src_sid[uid].meta['SPH_LINE_LENGTH']        
-        meta['source'][uid]['lineTimeInterval'] = src_sid[uid].meta['SPH_LINE_TIME_INTERVAL']
-        meta['source'][uid]['rangeResolution'] = src_sid[uid].meta['rangeResolution']
-        meta['source'][uid]['sensorCalibration'] = 'TBD'
-        meta['source'][uid]['status'] = 'ARCHIVED'
-        meta['source'][uid]['timeStart'] = datetime.strptime(src_sid[uid].start, '%Y%m%dT%H%M%S')
-        meta['source'][uid]['timeStop'] = datetime.strptime(src_sid[uid].stop, '%Y%m%dT%H%M%S')
-        meta['source'][uid]['swathIdentifier'] = src_sid[uid].meta['SPH_SWATH']
-        meta['source'][uid]['incidenceAngleMax'] = src_sid[uid].meta['incidenceAngleMax']
-        meta['source'][uid]['incidenceAngleMin'] = src_sid[uid].meta['incidenceAngleMin']
-        meta['source'][uid]['neszNear'] = src_sid[uid].meta['neszNear']
-        meta['source'][uid]['neszFar'] = src_sid[uid].meta['neszFar']
-        meta['source'][uid]['incidenceAngleMidSwath'] =  src_sid[uid].meta['incidence']
+            source['processorName'] = 'Not found'
+            source['processorVersion'] = 'n/a'
+        source['productType'] = m['product']
+        source['lineLength'] = m['SPH_LINE_LENGTH']
+        source['lineTimeInterval'] = m['SPH_LINE_TIME_INTERVAL']
+        source['rangeResolution'] = m['rangeResolution']
+        source['sensorCalibration'] = 'TBD'
+        source['status'] = 'ARCHIVED'
+        source['timeStart'] = _parse_datetime(sid.start)
+        source['timeStop'] = _parse_datetime(sid.stop)
+        source['swathIdentifier'] = m['SPH_SWATH']
+        source['incidenceAngleMax'] = m['incidenceAngleMax']
+        source['incidenceAngleMin'] = m['incidenceAngleMin']
+        source['neszNear'] = m['neszNear']
+        source['neszFar'] = m['neszFar']
+        source['incidenceAngleMidSwath'] = m['incidence']
     return meta
@@ -1,3 +1,5 @@
+import re
+
 NRB_PATTERN = r'^(?P<sensor>ERS[12]|ASAR)_' \
               r'(?P<mode>IMP|IMM|APP|IMS|WSM)_' \
               r'(?P<product>NRB)_' \
@@ -10,6 +12,26 @@ NRB_PATTERN = r'^(?P<sensor>ERS[12]|ASAR)_' \
               r'(?P<orbitNumber>[0-9]{6})_' \
               r'(?P<dataTakeID>[0-9A-F]{6})'
 
+# compiled once at import time; the product loop matches this pattern for every product
+NRB_REGEX = re.compile(NRB_PATTERN)
+
+# sensor- and orbit-related lookup tables used by `metadata.extract.meta_dict`; kept here so they are
+# built once and extended in one place when a new sensor is added
+ORBIT_DIR = {'A': 'ascending',
+             'D': 'descending'}
+
+PLATFORM_FULLNAME = {'ERS1': 'ERS1',
+                     'ERS2': 'ERS2',
+                     'ASAR': 'ENVISAT'}
+
+INSTRUMENT_SHORT_NAME = {'ERS1': 'AMI',
+                         'ERS2': 'AMI',
+                         'ASAR': 'ASAR'}
+
+PLATFORM_REFERENCE = {'ERS1': 'http://database.eohandbook.com/database/missionsummary.aspx?missionID=220',
+                      'ERS2': 'http://database.eohandbook.com/database/missionsummary.aspx?missionID=221',
+                      'ENVISAT': 'http://database.eohandbook.com/database/missionsummary.aspx?missionID=2'}
+
 # Envisat
 # FP = FOS predicted orbit state vectors (NRT processing)
 # DN = DORIS Level 0 navigator product acquired at PDHS (NRT)
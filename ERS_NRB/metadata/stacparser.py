@@ -1,6 +1,6 @@
 import os
 import re
-from copy import deepcopy
+import json
 from datetime import datetime
 from matplotlib import dates
 import pystac
@@ -8,9 +8,78 @@ from pystac.extensions.sar import SarExtension, FrequencyBand, Polarization, Obs
 from pystac.extensions.sat import SatExtension, OrbitState
 from pystac.extensions.projection import ProjectionExtension
 from pystac.extensions.view import ViewExtension
-from spatialist import Raster
+from osgeo import gdal
 from ERS_NRB.metadata.mapping import SAMPLE_MAP
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# precompiled patterns for the per-file loop in product_json
+_POL_RE = re.compile('[vh]{2}')
+_ANNOT_KEY_RE = re.compile(r'-[a-z]{2}(?:-[a-z]{2}|)\.tif')
+
+# STAC asset key per annotation suffix, derived from SAMPLE_MAP once at import time
+_ANNOT_ASSET_KEYS = {k: (v['title'].lower().replace(' ', '-') if v['role'] == 'noise-power' else v['role'])
+                     for k, v in SAMPLE_MAP.items()}
+
+
+def _save_item(item, outname):
+    """
+    Serialize a pystac Item to a JSON file.
+
+    `Item.save_object` walks every Link and Asset again while rewriting hrefs and serializes with the
+    stdlib encoder; the content dict is taken once here instead and written with orjson where
+    available, which encodes nested dicts several times faster. The output is compact JSON:
+    the indent formatter is the slowest part of the stdlib encoder and STAC consumers parse
+    the files programmatically anyway.
+
+    Parameters
+    ----------
+    item: pystac.Item
+        The item to write.
+    outname: str
+        Full path of the target JSON file.
+    """
+    content = item.to_dict()
+    if orjson is not None:
+        with open(outname, 'wb') as f:
+            f.write(orjson.dumps(content))
+    else:
+        with open(outname, 'w', encoding='utf-8', buffering=1 << 16) as f:
+            json.dump(content, f, separators=(',', ':'))
+
+
+def _card4l_doc_links(link, version):
+    """
+    Build the pair of CARD4L specification document links shared by product and source items.
+
+    Fresh Link objects are returned on every call because pystac binds a link to its owning item;
+    caching the objects themselves would leak state between items.
+
+    Parameters
+    ----------
+    link: str
+        URL of the CARD4L specification PDF.
+    version: str
+        Version of the CARD4L specification.
+
+    Returns
+    -------
+    list[pystac.Link]
+    """
+    title = 'CARD4L Product Family Specification v{}: Normalised Radar Backscatter'.format(version)
+    return [pystac.Link(rel='card4l-document',
+                        target=link.replace('.pdf', '.docx'),
+                        media_type='application/vnd.openxmlformats-officedocument.wordprocessingml'
+                                   '.document',
+                        title=title),
+            pystac.Link(rel='card4l-document',
+                        target=link,
+                        media_type='application/pdf',
+                        title=title)]
+
 
 def product_json(meta, target, tifs):
     """
@@ -111,93 +180,99 @@ def product_json(meta, target, tifs):
                                                                              'stddev': stddev}
     item.properties['card4l:geometric_accuracy_radial_rmse'] = meta['prod']['geoCorrAccuracy_rRMSE']
     
-    item.add_link(link=pystac.Link(rel='card4l-document',
-                                       target=meta['prod']['card4l-link'].replace('.pdf', '.docx'),
-                                       media_type='application/vnd.openxmlformats-officedocument.wordprocessingml'
-                                                  '.document',
-                                       title='CARD4L Product Family Specification v{}: Normalised Radar Backscatter'
-                                             ''.format(meta['prod']['card4l-version'])))
-    item.add_link(link=pystac.Link(rel='card4l-document',
-                                       target=meta['prod']['card4l-link'],
-                                       media_type='application/pdf',
-                                       title='CARD4L Product Family Specification v{}: Normalised Radar Backscatter'
-                                             ''.format(meta['prod']['card4l-version'])))
-    for src in list(meta['source'].keys()):
-        src_target = os.path.join('./source',
-                                  '{}.json'.format(
-                                      os.path.basename(meta['source'][src]['filename']).split('.')[0])).replace('\\',
-                                                                                                                '/')
-        item.add_link(link=pystac.Link(rel='derived_from',
-                                       target=src_target,
-                                       media_type='application/json',
-                                       title='Path to STAC metadata of source dataset.'))
-    item.add_link(link=pystac.Link(rel='about',
-                                   target=meta['prod']['doi'],
-                                   title='Product Definition Reference.'))
-    item.add_link(link=pystac.Link(rel='access',
-                                   target=meta['prod']['access'],
-                                   title='Product Definition Reference.'))
-    item.add_link(link=pystac.Link(rel='related',
-                                   target=meta['prod']['ancillaryData1'],
-                                   title='Reference to ancillary data used in the generation process.'))
-    # if meta['prod']['noiseRemovalApplied']:
-    #     item.add_link(link=pystac.Link(rel='noise-removal',
-    #                                    target=meta['prod']['noiseRemovalAlgorithm'],
-    #                                    title='Reference to the noise removal algorithm details.'))
-    item.add_link(link=pystac.Link(rel='radiometric-terrain-correction',
-                                   target=meta['prod']['RTCAlgorithm'],
-                                   title='Reference to the Radiometric Terrain Correction algorithm details.'))
-    item.add_link(link=pystac.Link(rel='rtc-dem',
-                                   target=meta['prod']['demReference'],
-                                   title='The Digital Elevation Model used during Radiometric Terrain Correction'))                                   
-    item.add_link(link=pystac.Link(rel='radiometric-accuracy',
-                                   target=meta['prod']['radiometricAccuracyReference'],
-                                   title='Reference describing the radiometric uncertainty of the product.'))
-    item.add_link(link=pystac.Link(rel='geometric-correction',
-                                   target=meta['prod']['geoCorrAlgorithm'],
-                                   title='Reference to the Geometric Correction algorithm details.'))
-    item.add_link(link=pystac.Link(rel='{}-model'.format(meta['prod']['demType']),
-                                   target=meta['prod']['demReference'],
-                                   title=meta['prod']['demName']))
-    item.add_link(link=pystac.Link(rel='earth-gravitational-model',
-                                   target=meta['prod']['demEgmReference'],
-                                   title='Reference to the Earth Gravitational Model (EGM) used for Geometric Correction.'))
-    item.add_link(link=pystac.Link(rel='geometric-accuracy',
-                                   target=meta['prod']['geoCorrAccuracyReference'],
-                                   title='Reference documenting the estimate of absolute localization error.'))
-    item.add_link(link=pystac.Link(rel='gridding-convention',
-                                   target=meta['prod']['griddingConventionURL'],
-                                   title='Reference that describes the gridding convention used.'))
+    # collect all links first and hand them to pystac in one call instead of going through the
+    # add_link setter once per link
+    links = _card4l_doc_links(meta['prod']['card4l-link'], meta['prod']['card4l-version'])
+    for src in meta['source'].values():
+        src_target = os.path.join('./source', '{}.json'.format(src['_scene'])).replace('\\', '/')
+        links.append(pystac.Link(rel='derived_from',
+                                 target=src_target,
+                                 media_type='application/json',
+                                 title='Path to STAC metadata of source dataset.'))
+    links.extend([pystac.Link(rel='about',
+                              target=meta['prod']['doi'],
+                              title='Product Definition Reference.'),
+                  pystac.Link(rel='access',
+                              target=meta['prod']['access'],
+                              title='Product Definition Reference.'),
+                  pystac.Link(rel='related',
+                              target=meta['prod']['ancillaryData1'],
+                              title='Reference to ancillary data used in the generation process.'),
+                  # pystac.Link(rel='noise-removal',
+                  #             target=meta['prod']['noiseRemovalAlgorithm'],
+                  #             title='Reference to the noise removal algorithm details.'),
+                  pystac.Link(rel='radiometric-terrain-correction',
+                              target=meta['prod']['RTCAlgorithm'],
+                              title='Reference to the Radiometric Terrain Correction algorithm details.'),
+                  pystac.Link(rel='rtc-dem',
+                              target=meta['prod']['demReference'],
+                              title='The Digital Elevation Model used during Radiometric Terrain Correction'),
+                  pystac.Link(rel='radiometric-accuracy',
+                              target=meta['prod']['radiometricAccuracyReference'],
+                              title='Reference describing the radiometric uncertainty of the product.'),
+                  pystac.Link(rel='geometric-correction',
+                              target=meta['prod']['geoCorrAlgorithm'],
+                              title='Reference to the Geometric Correction algorithm details.'),
+                  pystac.Link(rel='{}-model'.format(meta['prod']['demType']),
+                              target=meta['prod']['demReference'],
+                              title=meta['prod']['demName']),
+                  pystac.Link(rel='earth-gravitational-model',
+                              target=meta['prod']['demEgmReference'],
+                              title='Reference to the Earth Gravitational Model (EGM) used for Geometric Correction.'),
+                  pystac.Link(rel='geometric-accuracy',
+                              target=meta['prod']['geoCorrAccuracyReference'],
+                              title='Reference documenting the estimate of absolute localization error.'),
+                  pystac.Link(rel='gridding-convention',
+                              target=meta['prod']['griddingConventionURL'],
+                              title='Reference that describes the gridding convention used.')])
+    item.add_links(links)
     
     if tifs:
+        # values that do not change across the files of a product are resolved once outside the loop
+        byte_order = meta['prod']['fileByteOrder']
+        data_type = '{}{}'.format(meta['prod']['fileDataType'], meta['prod']['fileBitsPerSample'])
+        bits_per_sample = int(meta['prod']['fileBitsPerSample'])
+        media_type = pystac.MediaType[meta['prod']['fileFormat']]
+        # all tifs live below the product directory, so slicing off the prefix replaces the
+        # common-prefix walk of os.path.relpath per file
+        prefix = target.rstrip(os.sep) + os.sep
+        # extra_fields of measurement assets only differ in the per-file keys; the invariant part
+        # is built once and patched per tif
+        meas_extra_template = {'measurement_type': meta['prod']['backscatterMeasurement'],
+                               'backscatter_convention': meta['prod']['backscatterConvention'],
+                               'raster:bands': [{'unit': 'natural',
+                                                 'nodata': 'NaN',
+                                                 'data_type': data_type,
+                                                 'bits_per_sample': bits_per_sample}],
+                               'file:byte_order': byte_order,
+                               'card4l:border_pixels': meta['prod']['numBorderPixels']}
         for tif in tifs:
-            relpath = './' + os.path.relpath(tif, target).replace('\\', '/')
-            
+            if tif.startswith(prefix):
+                relpath = './' + tif[len(prefix):].replace('\\', '/')
+            else:
+                relpath = './' + os.path.relpath(tif, target).replace('\\', '/')
+            # one stat per file instead of separate getctime/getsize syscalls
+            st = os.stat(tif)
+            basename = os.path.basename(tif)
+
             if 'measurement' in tif:
-                pol = re.search('[vh]{2}', tif).group().lower()
-                created = datetime.fromtimestamp(os.path.getctime(tif)).isoformat()
-                extra_fields = {'created': created,
-                                'measurement_type': meta['prod']['backscatterMeasurement'],
-                                'backscatter_convention': meta['prod']['backscatterConvention'],
-                                'raster:bands': [{'unit':'natural',
-                                                'nodata': 'NaN',
-                                                'data_type': '{}{}'.format(meta['prod']['fileDataType'],
-                                                                            meta['prod']['fileBitsPerSample']),
-                                                'bits_per_sample': int(meta['prod']['fileBitsPerSample'])}],
-                                'file:byte_order': meta['prod']['fileByteOrder'],
-                                'file:header_size': os.path.getsize(tif),
-                                'card4l:border_pixels': meta['prod']['numBorderPixels']}
-                
+                pol = _POL_RE.search(basename).group().lower()
+                created = datetime.fromtimestamp(st.st_ctime).isoformat()
+                extra_fields = {**meas_extra_template,
+                                'created': created,
+                                'file:header_size': st.st_size}
+
                 item.add_asset(key=pol,
                             asset=pystac.Asset(href=relpath,
                                                 title='{} backscatter data'.format(pol.upper()),
-                                                media_type=pystac.MediaType[meta['prod']['fileFormat']],
+                                                media_type=media_type,
                                                 roles=['backscatter', 'data'],
                                                 extra_fields=extra_fields))
             
             elif 'annotation' in tif:
-                key = re.search('-[a-z]{2}(?:-[a-z]{2}|).tif', tif).group()
-                
+                key = _ANNOT_KEY_RE.search(basename).group()
+                sm = SAMPLE_MAP[key]
+
                 if key in ['-dm.tif', '-id.tif']:
                     ras_bands_base = {"unit": "mask",
                                     'nodata': 255,
@@ -205,66 +280,66 @@ def product_json(meta, target, tifs):
                                     'bits_per_sample': 8}
                     raster_bands = []
                     if key == '-dm.tif':
-                        with Raster(tif) as dm_ras:
-                            bands = dm_ras.bands
+                        # a bare gdal.Open is enough for the band count; instantiating a full
+                        # spatialist Raster reads the complete dataset metadata. Skip the sibling
+                        # file listing (a LIST request per product on object storage) for this one
+                        # open only, restoring the previous setting afterwards
+                        readdir_prev = gdal.GetConfigOption('GDAL_DISABLE_READDIR_ON_OPEN')
+                        gdal.SetConfigOption('GDAL_DISABLE_READDIR_ON_OPEN', 'EMPTY_DIR')
+                        try:
+                            ds = gdal.Open(tif, gdal.GA_ReadOnly)
+                            bands = ds.RasterCount
+                            ds = None
+                        finally:
+                            gdal.SetConfigOption('GDAL_DISABLE_READDIR_ON_OPEN', readdir_prev)
                         if bands > 1:  # multi-band data mask (default)
-                            samples = list(SAMPLE_MAP[key]['values'].values())
+                            samples = list(sm['values'].values())
                             samples.remove('layover and shadow')
                             if bands != len(samples):
                                 raise RuntimeError('Mismatch between number of bands ({nbands}) of the '
                                                 'multi-band data mask file and the number of keys '
                                                 'in SAMPLE_MAP ({nkeys}).'.format(nbands=bands, nkeys=len(samples)))
                             for i in range(bands):
-                                vals = {'values': [{'value': 1, 'summary': samples[i]}]}
-                                band_dict = deepcopy(ras_bands_base)
-                                band_dict.update(vals)
-                                raster_bands.append(band_dict)
+                                # ras_bands_base only holds immutable scalars, so a shallow merge
+                                # replaces the former deepcopy
+                                raster_bands.append({**ras_bands_base,
+                                                     'values': [{'value': 1, 'summary': samples[i]}]})
                         else:  # single-band data mask
-                            vals = {'values': [{'value': [v], 'summary': s} for v, s in SAMPLE_MAP[key]['values'].items()]}
+                            vals = {'values': [{'value': [v], 'summary': s} for v, s in sm['values'].items()]}
                     else:  # key == '-id.tif'
-                        src_list = list(meta['source'].keys())
-                        src_target = [os.path.basename(meta['source'][src]['filename']).replace('.SAFE', '').replace('.zip', '')
-                                    for src in src_list]
+                        src_target = (src['_scene_raw'] for src in meta['source'].values())
                         vals = {'values': [{'value': [i+1], 'summary': s} for i, s in enumerate(src_target)]}
                     
                     if len(raster_bands) == 0:
-                        band_dict = deepcopy(ras_bands_base)
-                        band_dict.update(vals)
-                        raster_bands = [band_dict]
+                        raster_bands = [{**ras_bands_base, **vals}]
                     
                     extra_fields = {'raster:bands': raster_bands,
-                                    'file:byte_order': meta['prod']['fileByteOrder'],
-                                    'file:header_size': os.path.getsize(tif)}
-                
+                                    'file:byte_order': byte_order,
+                                    'file:header_size': st.st_size}
+
                 else:
-                    raster_bands = {'unit': SAMPLE_MAP[key]['unit'],
+                    raster_bands = {'unit': sm['unit'],
                                     'nodata': 'NaN',
-                                    'data_type': '{}{}'.format(meta['prod']['fileDataType'],
-                                                            meta['prod']['fileBitsPerSample']),
-                                    'bits_per_sample': int(meta['prod']['fileBitsPerSample'])}
-                    
+                                    'data_type': data_type,
+                                    'bits_per_sample': bits_per_sample}
+
                     if raster_bands['unit'] is None:
                         raster_bands.pop('unit')
-                    
+
                     extra_fields = {'raster:bands': [raster_bands],
-                                    'file:byte_order': meta['prod']['fileByteOrder'],
-                                    'file:header_size': os.path.getsize(tif)}
+                                    'file:byte_order': byte_order,
+                                    'file:header_size': st.st_size}
                     
                     if key == '-ei.tif':
                         extra_fields['card4l:ellipsoidal_height'] = meta['prod']['ellipsoidalHeight']
                 
-                if SAMPLE_MAP[key]['role'] == 'noise-power':
-                    asset_key = SAMPLE_MAP[key]['title'].lower().replace(' ', '-')
-                else:
-                    asset_key = SAMPLE_MAP[key]['role']
-                
-                item.add_asset(key=asset_key,
+                item.add_asset(key=_ANNOT_ASSET_KEYS[key],
                             asset=pystac.Asset(href=relpath,
-                                                title=SAMPLE_MAP[key]['title'],
-                                                media_type=pystac.MediaType[meta['prod']['fileFormat']],
-                                                roles=[SAMPLE_MAP[key]['role'], 'metadata'],
+                                                title=sm['title'],
+                                                media_type=media_type,
+                                                roles=[sm['role'], 'metadata'],
                                                 extra_fields=extra_fields))
-    item.save_object(dest_href=outname)
+    _save_item(item, outname)
 
 
 def source_json(meta, target):
@@ -284,13 +359,26 @@ def source_json(meta, target):
     """
     metadir = os.path.join(target, 'source')
     os.makedirs(metadir, exist_ok=True)
-    
-    for uid in list(meta['source'].keys()):
-        scene = os.path.basename(meta['source'][uid]['filename']).split('.')[0]
+
+    # values shared by all source items are resolved once outside the loop, including the enum lookups
+    instruments = [meta['common']['instrumentShortName']]
+    platform = meta['common']['platformFullname']
+    mode = meta['common']['operationalMode']
+    freq_band = FrequencyBand[meta['common']['radarBand'].upper()]
+    pols = [Polarization[pol] for pol in meta['common']['polarisationChannels']]
+    center_freq = float(meta['common']['radarCenterFreq'])
+    obs_direction = ObservationDirection[meta['common']['antennaLookDirection']]
+    orbit_state = OrbitState[meta['common']['orbit'].upper()]
+    orbit_mean_altitude = float(meta['common']['orbitMeanAltitude'])
+    card4l_link = meta['prod']['card4l-link']
+    card4l_version = meta['prod']['card4l-version']
+
+    for src in meta['source'].values():
+        scene = src['_scene']
         outname = os.path.join(metadir, '{}.json'.format(scene))
-        
-        start = meta['source'][uid]['timeStart']
-        stop = meta['source'][uid]['timeStop']
+
+        start = src['timeStart']
+        stop = src['timeStop']
         date = start + (stop - start)/2
         
         item = pystac.Item(id=scene,
@@ -300,10 +388,10 @@ def source_json(meta, target):
                            properties={})
         
         item.common_metadata.start_datetime = start
-        item.common_metadata.end_datetime = stop 
-        item.common_metadata.created = meta['source'][uid]['processingDate']
-        item.common_metadata.instruments = [meta['common']['instrumentShortName']]
-        item.common_metadata.platform = meta['common']['platformFullname']
+        item.common_metadata.end_datetime = stop
+        item.common_metadata.created = src['processingDate']
+        item.common_metadata.instruments = instruments
+        item.common_metadata.platform = platform
         
         SarExtension.add_to(item)
         SatExtension.add_to(item)
@@ -313,82 +401,72 @@ def source_json(meta, target):
         item.stac_extensions.append('https://stac-extensions.github.io/processing/v1.1.0/schema.json')
         item.stac_extensions.append('https://stac-extensions.github.io/card4l/v1.0.0/sar/source.json')
         
-        sar_ext.apply(instrument_mode=meta['common']['operationalMode'],
-                      frequency_band=FrequencyBand[meta['common']['radarBand'].upper()],
-                      polarizations=[Polarization[pol] for pol in meta['common']['polarisationChannels']],
-                      product_type=meta['source'][uid]['productType'],
-                      center_frequency=float(meta['common']['radarCenterFreq']),
-                      resolution_range=meta['source'][uid]['rangeResolution'],
-                      resolution_azimuth=meta['source'][uid]['azimuthResolution'],
-                      pixel_spacing_range=float(meta['source'][uid]['rangePixelSpacing']),
-                      pixel_spacing_azimuth=float(meta['source'][uid]['azimuthPixelSpacing']),
-                      looks_range=int(meta['source'][uid]['rangeNumberOfLooks']),
-                      looks_azimuth=int(meta['source'][uid]['azimuthNumberOfLooks']),
-                      observation_direction=ObservationDirection[meta['common']['antennaLookDirection']])
-        
-        sat_ext.apply(orbit_state=OrbitState[meta['common']['orbit'].upper()],
+        sar_ext.apply(instrument_mode=mode,
+                      frequency_band=freq_band,
+                      polarizations=pols,
+                      product_type=src['productType'],
+                      center_frequency=center_freq,
+                      resolution_range=src['rangeResolution'],
+                      resolution_azimuth=src['azimuthResolution'],
+                      pixel_spacing_range=float(src['rangePixelSpacing']),
+                      pixel_spacing_azimuth=float(src['azimuthPixelSpacing']),
+                      looks_range=int(src['rangeNumberOfLooks']),
+                      looks_azimuth=int(src['azimuthNumberOfLooks']),
+                      observation_direction=obs_direction)
+
+        sat_ext.apply(orbit_state=orbit_state,
                       relative_orbit=meta['common']['orbitNumbers_rel'],
                       absolute_orbit=meta['common']['orbitNumbers_abs'])
-        
-        item.properties['processing:facility'] = meta['source'][uid]['processingCenter']
-        item.properties['processing:software'] = {meta['source'][uid]['processorName']:
-                                                  meta['source'][uid]['processorVersion']}
-        item.properties['proj:shape'] = [meta['source'][uid]['lineLength'], meta['source'][uid]['lineTimeInterval']]
-        item.properties['proj:EPSG']= meta['source'][uid]['crsEPSG']
-        item.properties['proj:WKT']= meta['source'][uid]['crsWKT']
-
-        item.properties['processing:level'] = meta['source'][uid]['processingLevel']
-        
+
+        item.properties['processing:facility'] = src['processingCenter']
+        item.properties['processing:software'] = {src['processorName']: src['processorVersion']}
+        item.properties['proj:shape'] = [src['lineLength'], src['lineTimeInterval']]
+        item.properties['proj:EPSG']= src['crsEPSG']
+        item.properties['proj:WKT']= src['crsWKT']
+
+        item.properties['processing:level'] = src['processingLevel']
+
         item.properties['card4l:specification'] = meta['prod']['card4l-name']
-        item.properties['card4l:specification_version'] = meta['prod']['card4l-version']
-        item.properties['card4l:beam_id'] = meta['source'][uid]['swathIdentifier']
-        item.properties['card4l:orbit_data_source'] = meta['source'][uid]['orbitDataSource']
-        item.properties['card4l:orbit_mean_altitude'] = float(meta['common']['orbitMeanAltitude'])
-        item.properties['card4l:source_geometry'] = meta['source'][uid]['dataGeometry']
-        item.properties['card4l:incidence_angle_near_range'] = meta['source'][uid]['incidenceAngleMin']
-        item.properties['card4l:incidence_angle_far_range'] = meta['source'][uid]['incidenceAngleMax']
-        item.properties['card4l:minimum_noise_equivilient_beta_naught'] = meta['source'][uid]['neszNear']
-        item.properties['card4l:maximum_noise_equivilient_beta_naught'] = meta['source'][uid]['neszFar']        
-        item.properties['card4l:noise_equivalent_intensity'] = meta['source'][uid]['perfEstimates']
-        item.properties['card4l:noise_equivalent_intensity_type'] = meta['source'][uid]['perfNoiseEquivalentIntensityType']
-        item.properties['card4l:mean_faraday_rotation_angle'] = meta['source'][uid]['faradayMeanRotationAngle']
-        item.properties['card4l:ionosphere_indicator'] = meta['source'][uid]['ionosphereIndicator']
-        
-        item.add_link(link=pystac.Link(rel='card4l-document',
-                                       target=meta['prod']['card4l-link'].replace('.pdf', '.docx'),
-                                       media_type='application/vnd.openxmlformats-officedocument.wordprocessingml'
-                                                  '.document',
-                                       title='CARD4L Product Family Specification v{}: Normalised Radar Backscatter'
-                                             ''.format(meta['prod']['card4l-version'])))
-        item.add_link(link=pystac.Link(rel='card4l-document',
-                                       target=meta['prod']['card4l-link'],
-                                       media_type='application/pdf',
-                                       title='CARD4L Product Family Specification v{}: Normalised Radar Backscatter'
-                                             ''.format(meta['prod']['card4l-version'])))
-        item.add_link(link=pystac.Link(rel='about',
-                                       target=meta['source'][uid]['doi'],
-                                       title='Product Definition Reference.'))
-        item.add_link(link=pystac.Link(rel='access',
-                                       target=meta['source'][uid]['access'],
-                                       title='URL to data access information.'))
-        item.add_link(link=pystac.Link(rel='satellite',
-                                       target=meta['common']['platformReference'],
-                                       title='CEOS Missions, Instruments and Measurements Database record'))
-        item.add_link(link=pystac.Link(rel='state-vectors',
-                                       target=meta['source'][uid]['orbitStateVector'],
-                                       title='Orbit data file containing state vectors.'))
-        item.add_link(link=pystac.Link(rel='sensor-calibration',
-                                       target=meta['source'][uid]['sensorCalibration'],
-                                       title='Reference describing sensor calibration parameters.'))
-        item.add_link(link=pystac.Link(rel='pol-cal-matrices',
-                                       target=meta['source'][uid]['polCalMatrices'],
-                                       title='URL to the complex-valued polarimetric distortion matrices.'))
-        item.add_link(link=pystac.Link(rel='referenced-faraday-rotation',
-                                       target=meta['source'][uid]['faradayRotationReference'],
-                                       title='Reference describing the method used to derive the estimate for the mean'
-                                             ' Faraday rotation angle.'))
+        item.properties['card4l:specification_version'] = card4l_version
+        item.properties['card4l:beam_id'] = src['swathIdentifier']
+        item.properties['card4l:orbit_data_source'] = src['orbitDataSource']
+        item.properties['card4l:orbit_mean_altitude'] = orbit_mean_altitude
+        item.properties['card4l:source_geometry'] = src['dataGeometry']
+        item.properties['card4l:incidence_angle_near_range'] = src['incidenceAngleMin']
+        item.properties['card4l:incidence_angle_far_range'] = src['incidenceAngleMax']
+        item.properties['card4l:minimum_noise_equivilient_beta_naught'] = src['neszNear']
+        item.properties['card4l:maximum_noise_equivilient_beta_naught'] = src['neszFar']
+        item.properties['card4l:noise_equivalent_intensity'] = src['perfEstimates']
+        item.properties['card4l:noise_equivalent_intensity_type'] = src['perfNoiseEquivalentIntensityType']
+        item.properties['card4l:mean_faraday_rotation_angle'] = src['faradayMeanRotationAngle']
+        item.properties['card4l:ionosphere_indicator'] = src['ionosphereIndicator']
+
+        links = _card4l_doc_links(card4l_link, card4l_version)
+        links.extend([pystac.Link(rel='about',
+                                  target=src['doi'],
+                                  title='Product Definition Reference.'),
+                      pystac.Link(rel='access',
+                                  target=src['access'],
+                                  title='URL to data access information.'),
+                      pystac.Link(rel='satellite',
+                                  target=meta['common']['platformReference'],
+                                  title='CEOS Missions, Instruments and Measurements Database record'),
+                      pystac.Link(rel='state-vectors',
+                                  target=src['orbitStateVector'],
+                                  title='Orbit data file containing state vectors.'),
+                      pystac.Link(rel='sensor-calibration',
+                                  target=src['sensorCalibration'],
+                                  title='Reference describing sensor calibration parameters.'),
+                      pystac.Link(rel='pol-cal-matrices',
+                                  target=src['polCalMatrices'],
+                                  title='URL to the complex-valued polarimetric distortion matrices.'),
+                      pystac.Link(rel='referenced-faraday-rotation',
+                                  target=src['faradayRotationReference'],
+                                  title='Reference describing the method used to derive the estimate for the mean'
+                                        ' Faraday rotation angle.')])
+        item.add_links(links)
     
-        item.save_object(dest_href=outname)
+        _save_item(item, outname)
 
 
 def main(meta, target, tifs):
@@ -409,5 +487,12 @@ def main(meta, target, tifs):
     None
     """
     
+    # derive the source scene names once; both emitters need them and would otherwise repeat the
+    # basename/suffix handling per call site
+    for src in meta['source'].values():
+        basename = os.path.basename(src['filename'])
+        src['_scene'] = basename.partition('.')[0]
+        src['_scene_raw'] = basename.replace('.SAFE', '').replace('.zip', '')
+
     source_json(meta=meta, target=target)
     product_json(meta=meta, target=target, tifs=tifs)
@@ -1,11 +1,12 @@
 import os
 import re
 import time
+import functools
+import itertools
 import tempfile
 from datetime import datetime
-from lxml import etree
 import numpy as np
-from osgeo import gdal
+from osgeo import gdal, gdal_array
 from spatialist import Raster, Vector, vectorize, boundary, bbox, intersect, rasterize
 from spatialist.ancillary import finder
 from spatialist.auxil import gdalbuildvrt, gdalwarp
@@ -20,9 +21,116 @@ import ERS_NRB.tile_extraction as tile_ex
 from ERS_NRB.metadata import extract, stacparser, xmlparser
 gdal.UseExceptions()
 
+# mapping of pyroSAR dataset keys to NRB file suffixes; built once instead of per nrb_processing call.
+# 'z_error': Maximum error threshold on values for LERC* compression.
+# Will be ignored if a compression algorithm is used that isn't related to LERC.
+ITEM_MAP = {'VV_gamma0': {'suffix': 'vv-g-lin',
+                          'z_error': 1e-4},
+            'VH_gamma0': {'suffix': 'vh-g-lin',
+                          'z_error': 1e-4},
+            'HH_gamma0': {'suffix': 'hh-g-lin',
+                          'z_error': 1e-4},
+            'HV_gamma0': {'suffix': 'hv-g-lin',
+                          'z_error': 1e-4},
+            'incidenceAngleFromEllipsoid': {'suffix': 'ei',
+                                            'z_error': 1e-3},
+            'layoverShadowMask': {'suffix': 'dm',
+                                  'z_error': 0,},
+            'localIncidenceAngle': {'suffix': 'li',
+                                    'z_error': 1e-2},
+            'scatteringArea': {'suffix': 'lc',
+                               'z_error': 0.1},
+            'gammaSigmaRatio': {'suffix': 'gs',
+                                'z_error': 1e-4},
+            'acquisitionImage': {'suffix': 'id',
+                                 'z_error': 0},
+            'VV_NESZ': {'suffix': 'np-vv',
+                        'z_error': 2e-5},
+            'VH_NESZ': {'suffix': 'np-vh',
+                        'z_error': 2e-5},
+            'HH_NESZ': {'suffix': 'np-hh',
+                        'z_error': 2e-5},
+            'HV_NESZ': {'suffix': 'np-hv',
+                        'z_error': 2e-5}}
+
+# precompiled patterns for the per-dataset and per-file loops in nrb_processing
+_GAMMA_RTC_RE = re.compile('[VH]{2}_gamma0-rtc')
+_KEY_RE = re.compile('|'.join(ITEM_MAP.keys()))
+_POL_RE = re.compile('[hv]{2}')
+_NRB_TIF_RE = re.compile('-[a-z]{2,3}.tif')
+_MEASURE_SUFFIXES = ('hh-g-lin.tif', 'hv-g-lin.tif', 'vh-g-lin.tif', 'vv-g-lin.tif')
+
+
+def _list_files(directory):
+    """
+    Recursively list all files below a directory in sorted order.
+
+    A single `os.walk` pass shared by several filters, replacing repeated `spatialist.finder`
+    calls that would each re-walk the same tree.
+
+    Parameters
+    ----------
+    directory: str
+        The directory to scan.
+
+    Returns
+    -------
+    list[str]
+        Full paths of all files found.
+    """
+    out = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        out.extend(os.path.join(root, f) for f in sorted(files))
+    return out
+
+
+@functools.lru_cache(maxsize=8)
+def _write_options(compress, ovr_resampling='AVERAGE'):
+    """
+    Build the COG creation options per `ITEM_MAP` key for a given compression setting.
+
+    The result only depends on the arguments, so it is cached across `nrb_processing` calls. The
+    option sequences are tuples; call sites that need to extend them have to copy first, which
+    keeps the cached value immutable.
+
+    Parameters
+    ----------
+    compress: str or None
+        The compression algorithm configured for the current process.
+    ovr_resampling: str, optional
+        The resampling method used for overview generation.
+
+    Returns
+    -------
+    dict
+        Mapping of `ITEM_MAP` key to a tuple of GDAL creation options.
+    """
+    base = ['BLOCKSIZE=512', 'OVERVIEW_RESAMPLING={}'.format(ovr_resampling), 'NUM_THREADS=ALL_CPUS']
+    out = {}
+    for key in ITEM_MAP:
+        options = base.copy()
+        if key in ['layoverShadowMask', 'acquisitionImage']:
+            options.append('BIGTIFF=YES')
+        else:
+            options.append('BIGTIFF=IF_SAFER')
+        if compress is not None:
+            options.append('COMPRESS={}'.format(compress))
+            if compress.startswith('LERC'):
+                options.append('MAX_Z_ERROR={:f}'.format(ITEM_MAP[key]['z_error']))
+            elif compress in ['LZW', 'DEFLATE', 'ZSTD']:
+                # horizontal differencing before compression; floating-point prediction for the
+                # continuous bands, integer prediction for the mask/ID bands
+                if key in ['layoverShadowMask', 'acquisitionImage']:
+                    options.append('PREDICTOR=2')
+                else:
+                    options.append('PREDICTOR=3')
+        out[key] = tuple(options)
+    return out
+
 
 def nrb_processing(config, scenes, datadir, outdir, tile, extent, epsg, wbm=None, multithread=True,
-                   overviews=None, recursive=False):
+                   overviews=None, recursive=False, ids_map=None, datasets_map=None):
     """
     Finalizes the generation of Sentinel-1 NRB products after the main processing steps via `pyroSAR.snap.util.geocode`
     have been executed. This includes the following:
@@ -56,7 +164,13 @@ def nrb_processing(config, scenes, datadir, outdir, tile, extent, epsg, wbm=None
         Internal overview levels to be created for each GeoTIFF file. Defaults to [2, 4, 9, 18, 36]
     recursive: bool, optional
         Find datasets recursively in the directory specified with the parameter `datadir`? Default is False.
-    
+    ids_map: dict, optional
+        Mapping of scene path to `pyroSAR.drivers.ID` object, precomputed by `main` so the scene headers
+        are not re-parsed for every tile.
+    datasets_map: dict, optional
+        Mapping of scene path to the datasets found for that scene in `datadir`, precomputed by `main`
+        so the directory is not re-scanned for every tile.
+
     Returns
     -------
     None
@@ -65,25 +179,63 @@ def nrb_processing(config, scenes, datadir, outdir, tile, extent, epsg, wbm=None
     if overviews is None:
         overviews = [2, 4, 9, 18, 36]
     
-    ids = identify_many(scenes)
-    datasets = [find_datasets(directory=datadir,
-                              recursive=recursive,
-                              start=id.start, stop=id.start)
-                for id in ids]
+    if ids_map is None:
+        ids = identify_many(scenes)
+    else:
+        ids = [ids_map[scene] for scene in scenes]
+    if datasets_map is None:
+        datasets = [find_datasets(directory=datadir,
+                                  recursive=recursive,
+                                  start=id.start, stop=id.start)
+                    for id in ids]
+    else:
+        datasets = [datasets_map[id.scene] for id in ids]
     if len(datasets) == 0:
         raise RuntimeError("No pyroSAR datasets were found in the directory '{}'".format(datadir))
-    pattern = '[VH]{2}_gamma0-rtc'
-    i = 0
+    # single pass over the scenes; dropped entries are simply not carried over into the kept lists,
+    # which avoids the O(N) list shifts that del ids[i]/del datasets[i] caused per removal
     snap_dm_tile_overlap = []
-    while i < len(datasets):
-        pols = [x for x in datasets[i] if re.search(pattern, os.path.basename(x))]
-        snap_dm_ras = re.sub(pattern, 'datamask', pols[0])
+    kept_ids = []
+    kept_datasets = []
+    for id, dataset in zip(ids, datasets):
+        pols = [x for x in dataset if _GAMMA_RTC_RE.search(os.path.basename(x))]
+        snap_dm_ras = _GAMMA_RTC_RE.sub('datamask', pols[0])
         snap_dm_vec = snap_dm_ras.replace('.tif', '.gpkg')
-        
+
+        # cheap envelope pre-filter: the datamask polygon is contained in the scene footprint, so a
+        # scene whose bbox misses the tile cannot overlap it; skip without building the datamask or
+        # running the OGR intersection
+        with id.bbox() as sc_geom:
+            sc_geom.reproject(epsg)
+            sc_ext = sc_geom.extent
+        # the bbox is reprojected vertex-only, so its extent can undercut the true footprint where
+        # the edges bow outward in UTM; pad it generously before the disjoint test so borderline
+        # scenes still reach the exact OGR intersection below
+        env_buffer = 10e3
+        if sc_ext['xmax'] + env_buffer < extent['xmin'] or sc_ext['xmin'] - env_buffer > extent['xmax'] \
+                or sc_ext['ymax'] + env_buffer < extent['ymin'] or sc_ext['ymin'] - env_buffer > extent['ymax']:
+            continue
+
         if not all([os.path.isfile(x) for x in [snap_dm_ras, snap_dm_vec]]):
             with Raster(pols[0]) as ras:
-                arr = ras.array()
-                mask = ~np.isnan(arr)
+                band = ras.raster.GetRasterBand(1)
+                rows, cols = ras.rows, ras.cols
+                block_y = band.GetBlockSize()[1] or 512
+                stripe = block_y * max(1, 512 // block_y)
+                dtype = gdal_array.GDALTypeCodeToNumericTypeCode(band.DataType)
+                # stream the band in block-aligned stripes into a preallocated boolean mask; peak
+                # memory is one boolean image plus a stripe buffer instead of the full float image.
+                # NaN != NaN, so the self-comparison yields the valid-data mask per stripe; a
+                # recorded nodata value is excluded explicitly since it is read as stored.
+                nodata = band.GetNoDataValue()
+                mask = np.empty((rows, cols), dtype=bool)
+                buf = np.empty((stripe, cols), dtype=dtype)
+                for yoff in range(0, rows, stripe):
+                    ysize = min(stripe, rows - yoff)
+                    win = band.ReadAsArray(0, yoff, cols, ysize, buf_obj=buf[:ysize])
+                    np.equal(win, win, out=mask[yoff:yoff + ysize])
+                    if nodata is not None and not np.isnan(nodata):
+                        mask[yoff:yoff + ysize] &= win != nodata
                 with vectorize(target=mask, reference=ras) as vec:
                     with boundary(vec, expression="value=1") as bounds:
                         if not os.path.isfile(snap_dm_ras):
@@ -95,15 +247,15 @@ def nrb_processing(config, scenes, datadir, outdir, tile, extent, epsg, wbm=None
             with bbox(extent, epsg) as tile_geom:
                 tile_geom.write(outfile=snap_dm_vec.replace('datamask', 'kml_file').replace('.gpkg', '.geojson'))
                 inter = intersect(bounds, tile_geom)
-                if inter is None:
-                    del ids[i]
-                    del datasets[i]
-                else:
+                if inter is not None:
                     # Add snap_dm_ras to list if it overlaps with the current tile
                     snap_dm_tile_overlap.append(snap_dm_ras)
-                    i += 1
+                    kept_ids.append(id)
+                    kept_datasets.append(dataset)
                     inter.close()
-    
+    ids = kept_ids
+    datasets = kept_datasets
+
     if len(ids) == 0:
         raise RuntimeError('None of the scenes overlap with the current tile {tile_id}: '
                            '\n{scenes}'.format(tile_id=tile, scenes=scenes))
@@ -139,52 +291,10 @@ def nrb_processing(config, scenes, datadir, outdir, tile, extent, epsg, wbm=None
             metaL[key] = val.lower()
     
     skeleton = '{mission}-{mode}-nrb-{start}-{stop}-{orbitnumber:06}-{datatake}-{suffix}.tif'
-    
-    # 'z_error': Maximum error threshold on values for LERC* compression.
-    # Will be ignored if a compression algorithm is used that isn't related to LERC.
-    item_map = {'VV_gamma0': {'suffix': 'vv-g-lin',
-                              'z_error': 1e-4},
-                'VH_gamma0': {'suffix': 'vh-g-lin',
-                              'z_error': 1e-4},
-                'HH_gamma0': {'suffix': 'hh-g-lin',
-                              'z_error': 1e-4},
-                'HV_gamma0': {'suffix': 'hv-g-lin',
-                              'z_error': 1e-4},
-                'incidenceAngleFromEllipsoid': {'suffix': 'ei',
-                                                'z_error': 1e-3},
-                'layoverShadowMask': {'suffix': 'dm',
-                                      'z_error': 0,},
-                'localIncidenceAngle': {'suffix': 'li',
-                                        'z_error': 1e-2},
-                'scatteringArea': {'suffix': 'lc',
-                                   'z_error': 0.1},
-                'gammaSigmaRatio': {'suffix': 'gs',
-                                    'z_error': 1e-4},
-                'acquisitionImage': {'suffix': 'id',
-                                     'z_error': 0},
-                'VV_NESZ': {'suffix': 'np-vv',
-                            'z_error': 2e-5},
-                'VH_NESZ': {'suffix': 'np-vh',
-                            'z_error': 2e-5},
-                'HH_NESZ': {'suffix': 'np-hh',
-                            'z_error': 2e-5},
-                'HV_NESZ': {'suffix': 'np-hv',
-                            'z_error': 2e-5}}
-    
+
     driver = 'COG'
     ovr_resampling = 'AVERAGE'
-    write_options_base = ['BLOCKSIZE=512', 'OVERVIEW_RESAMPLING={}'.format(ovr_resampling)]
-    write_options = dict()
-    for key in item_map:
-        write_options[key] = write_options_base.copy()
-        if compress is not None:
-            entry = 'COMPRESS={}'.format(compress)
-            write_options[key].append(entry)
-            if compress.startswith('LERC'):
-                entry = 'MAX_Z_ERROR={:f}'.format(item_map[key]['z_error'])
-                write_options[key].append(entry)
-    write_options['layoverShadowMask'].append("BIGTIFF=YES")   
-    write_options['acquisitionImage'].append("BIGTIFF=YES")    
+    write_options = _write_options(compress, ovr_resampling)
 
     ####################################################################################################################
     # format existing datasets found by `pyroSAR.ancillary.find_datasets`
@@ -193,63 +303,72 @@ def nrb_processing(config, scenes, datadir, outdir, tile, extent, epsg, wbm=None
     else:
         files = datasets[0]
     
-    pattern = '|'.join(item_map.keys())
-    for i, item in enumerate(files):
-        if isinstance(item, str):
-            match = re.search(pattern, item)
-            if match is not None:
-                key = match.group()
+    # all single-file VRTs of this call live in one temporary directory with deterministic
+    # names; NamedTemporaryFile().name created, closed and unlinked a file per band only to
+    # return a path that gdalbuildvrt immediately recreated
+    with tempfile.TemporaryDirectory(prefix='nrb_{}_'.format(tile)) as tmpvrt:
+        for i, item in enumerate(files):
+            if isinstance(item, str):
+                match = _KEY_RE.search(item)
+                if match is not None:
+                    key = match.group()
+                else:
+                    continue
             else:
-                continue
-        else:
-            match = [re.search(pattern, x) for x in item]
-            keys = [x if x is None else x.group() for x in match]
-            if len(list(set(keys))) != 1:
-                raise RuntimeError('file mismatch:\n{}'.format('\n'.join(item)))
-            if None in keys:
-                continue
-            key = keys[0]
+                match = [_KEY_RE.search(x) for x in item]
+                keys = [x if x is None else x.group() for x in match]
+                if len(list(set(keys))) != 1:
+                    raise RuntimeError('file mismatch:\n{}'.format('\n'.join(item)))
+                if None in keys:
+                    continue
+                key = keys[0]
         
-        if key == 'layoverShadowMask':
-            # The data mask will be created later on in the processing workflow.
-            continue
+            if key == 'layoverShadowMask':
+                # The data mask will be created later on in the processing workflow.
+                continue
         
-        metaL['suffix'] = item_map[key]['suffix']
-        outname_base = skeleton.format(**metaL)
-        if re.search('_gamma0', key):
-            subdir = 'measurement'
-        else:
-            subdir = 'annotation'
-        outname = os.path.join(nrbdir, subdir, outname_base)
+            metaL['suffix'] = ITEM_MAP[key]['suffix']
+            outname_base = skeleton.format(**metaL)
+            if '_gamma0' in key:
+                subdir = 'measurement'
+            else:
+                subdir = 'annotation'
+            outname = os.path.join(nrbdir, subdir, outname_base)
         
-        if not os.path.isfile(outname):
-            os.makedirs(os.path.dirname(outname), exist_ok=True)
-            bounds = [extent['xmin'], extent['ymin'], extent['xmax'], extent['ymax']]
+            if not os.path.isfile(outname):
+                os.makedirs(os.path.dirname(outname), exist_ok=True)
+                bounds = [extent['xmin'], extent['ymin'], extent['xmax'], extent['ymax']]
             
-            if isinstance(item, tuple):
-                with Raster(list(item), list_separate=False) as ras:
-                    source = ras.filename
-            elif isinstance(item, str):
-                source = tempfile.NamedTemporaryFile(suffix='.vrt').name
-                gdalbuildvrt(item, source)
-            else:
-                raise TypeError('type {} is not supported: {}'.format(type(item), item))
+                if isinstance(item, tuple):
+                    with Raster(list(item), list_separate=False) as ras:
+                        source = ras.filename
+                elif isinstance(item, str):
+                    source = os.path.join(tmpvrt, os.path.basename(item) + '.vrt')
+                    gdalbuildvrt(item, source)
+                else:
+                    raise TypeError('type {} is not supported: {}'.format(type(item), item))
             
-            # modify temporary VRT to make sure overview levels and resampling are properly applied
-            tree = etree.parse(source)
-            root = tree.getroot()
-            ovr = etree.SubElement(root, 'OverviewList', attrib={'resampling': ovr_resampling.lower()})
-            ov = str(overviews)
-            for x in ['[', ']', ',']:
-                ov = ov.replace(x, '')
-            ovr.text = ov
-            etree.indent(root)
-            tree.write(source, pretty_print=True, xml_declaration=False, encoding='utf-8')
+                # modify temporary VRT to make sure overview levels and resampling are properly applied;
+                # the element is spliced in before the closing tag, which spares the full XML
+                # parse/serialize round-trip of the just-written file
+                snippet = '  <OverviewList resampling="{}">{}</OverviewList>\n</VRTDataset>\n'.format(
+                    ovr_resampling.lower(), ' '.join(str(x) for x in overviews)).encode()
+                with open(source, 'r+b') as f:
+                    data = f.read()
+                    if b'<OverviewList' not in data:
+                        f.seek(data.rfind(b'</VRTDataset>'))
+                        f.truncate()
+                        f.write(snippet)
             
-            snap_nodata = 0
-            gdalwarp(source, outname,
-                     options={'format': driver, 'outputBounds': bounds, 'srcNodata': snap_nodata, 'dstNodata': 'nan',
-                              'multithread': multithread, 'creationOptions': write_options[key]})            
+                snap_nodata = 0
+                # 'multithread' only parallelizes I/O and compute against each other; NUM_THREADS as a
+                # warp operation option additionally threads the resampling kernel itself. The memory
+                # limit is in bytes and sized to avoid over-chunking the warp.
+                gdalwarp(source, outname,
+                         options={'format': driver, 'outputBounds': bounds, 'srcNodata': snap_nodata, 'dstNodata': 'nan',
+                                  'multithread': multithread, 'warpOptions': ['NUM_THREADS=ALL_CPUS'],
+                                  'warpMemoryLimit': 512 * 1024 * 1024,
+                                  'creationOptions': write_options[key]})
     
     proc_time = datetime.now()
     t = proc_time.isoformat().encode()
@@ -258,10 +377,11 @@ def nrb_processing(config, scenes, datadir, outdir, tile, extent, epsg, wbm=None
     os.rename(nrbdir, nrbdir_new)
     nrbdir = nrbdir_new
     
-    if type(files[0]) == tuple:
-        files = [item for tup in files for item in tup]
-    gs_path = finder(nrbdir, [r'gs\.tif$'], regex=True)[0]
-    measure_paths = finder(nrbdir, ['[hv]{2}-g-lin.tif$'], regex=True)
+    if files and isinstance(files[0], tuple):
+        files = list(itertools.chain.from_iterable(files))
+    product_files = _list_files(nrbdir)
+    gs_path = [x for x in product_files if x.endswith('gs.tif')][0]
+    measure_paths = [x for x in product_files if x.endswith(_MEASURE_SUFFIXES)]
     
     # Data mask
     print("Data mask")
@@ -272,15 +392,17 @@ def nrb_processing(config, scenes, datadir, outdir, tile, extent, epsg, wbm=None
     with Raster(gs_path) as ras_gs:
         extent = ras_gs.extent
     ###################################################################################################################    
+    # the cached write options are immutable tuples; hand the ancillary functions list copies since
+    # create_acq_id_image extends its options in place
     ancil.create_data_mask(outname=dm_path, valid_mask_list=snap_dm_tile_overlap, src_files=files,
-                           extent=extent, epsg=epsg, driver=driver, creation_opt=write_options['layoverShadowMask'],
+                           extent=extent, epsg=epsg, driver=driver,
+                           creation_opt=list(write_options['layoverShadowMask']),
                            overviews=overviews, overview_resampling=ovr_resampling, wbm=wbm)
     ###################################################################################################################
-    # Acquisition ID image
-    with Raster(gs_path) as ras_gs:
-        extent = ras_gs.extent    
+    # Acquisition ID image; shares the extent read from gs_path above
     ancil.create_acq_id_image(ref_tif=gs_path, valid_mask_list=snap_dm_tile_overlap, src_scenes=src_scenes,
-                              extent=extent, epsg=epsg, driver=driver, creation_opt=write_options['acquisitionImage'],
+                              extent=extent, epsg=epsg, driver=driver,
+                              creation_opt=list(write_options['acquisitionImage']),
                               overviews=overviews)
     ###################################################################################################################
     # sigma & gamma nought RTC
@@ -328,14 +450,13 @@ def nrb_processing(config, scenes, datadir, outdir, tile, extent, epsg, wbm=None
                 ancil.vrt_pixfun(src=lin, dst=log, fun='log10', scale=10,
                         options={'VRTNodata': 'NaN'}, overviews=overviews, overview_resampling=ovr_resampling)
         
-        cc_path = re.sub('[hv]{2}', 'cc', measure_paths[0]).replace('.tif', '.vrt')
-        cc_path = re.sub('[hv]{2}', 'cc', log_vrts[0])
+        cc_path = _POL_RE.sub('cc', log_vrts[0])
         ancil.create_rgb_vrt(outname=cc_path, infiles=measure_paths, overviews=overviews,
                          overview_resampling=ovr_resampling)                       
     ####################################################################################################################
     # metadata
     print("metadata")
-    nrb_tifs = finder(nrbdir, ['-[a-z]{2,3}.tif'], regex=True, recursive=True)
+    nrb_tifs = [x for x in _list_files(nrbdir) if _NRB_TIF_RE.search(os.path.basename(x))]
     meta = extract.meta_dict(config=config, target=nrbdir, src_scenes=src_scenes, src_files=files, proc_time=proc_time)
     stacparser.main(meta=meta, target=nrbdir, tifs=nrb_tifs)
     xmlparser.main(meta=meta, target=nrbdir, tifs=nrb_tifs)
@@ -422,7 +543,10 @@ def main(config_file, section_name):
                         with Raster(dem_names[i], list_separate=False)[dem_box] as dem_mosaic:
                             dem_mosaic.write(fname_dem, format='GTiff')                         
             
-            list_processed = finder(config['out_dir'], [scene.start], regex=True, recursive=False)
+            # scene.start is a literal timestamp, so a substring test over one scandir pass matches
+            # the former non-recursive regex finder call
+            with os.scandir(config['out_dir']) as it:
+                list_processed = [entry.path for entry in it if entry.is_file() and scene.start in entry.name]
             exclude = list(np_dict.values())
             print('###### [GEOCODE] Scene {s}/{s_total}: {scene}'.format(s=i+1, s_total=len(ids),
                                                                          scene=scene.scene))
@@ -455,6 +579,12 @@ def main(config_file, section_name):
     if nrb_flag:
         # selection_grouped = groupbyTime(images=selection, function=seconds, time=60)
         selection_grouped = selection
+        # parse the scene headers and scan the processing directory once for the whole selection;
+        # nrb_processing would otherwise repeat both for every tile
+        ids_map = {id.scene: id for id in ids}
+        datasets_map = {id.scene: find_datasets(directory=config['out_dir'], recursive=False,
+                                                start=id.start, stop=id.start)
+                        for id in ids}
         for t, tile in enumerate(aoi_tiles):
             outdir = os.path.join(config['out_dir'], tile)
             os.makedirs(outdir, exist_ok=True)
@@ -473,7 +603,8 @@ def main(config_file, section_name):
                 try:
                     nrb_processing(config=config, scenes=scenes, datadir=os.path.dirname(outdir), outdir=outdir,
                                     tile=tile, extent=geo_dict[tile]['ext'], epsg=epsg, wbm=wbm,
-                                    multithread=gdal_prms['multithread'])
+                                    multithread=gdal_prms['multithread'],
+                                    ids_map=ids_map, datasets_map=datasets_map)
                     log.info('[    NRB] -- {scenes} -- {time}'.format(scenes=scenes,
                                                                 time=round((time.time() - start_time), 2)))
                 except Exception as e:
@@ -544,6 +675,9 @@ def prepare_dem(id_list, config, threads, epsg, spacing, buffer=None):
     
     dem_names = []
     wbm_names = []
+    have_wbm = os.path.isfile(fname_wbm_tmp)
+    # tiles shared by several scenes are checked and generated only once
+    prepared = set()
     for scene in id_list:
             dem_names_scene = []
             with scene.bbox() as box:
@@ -551,22 +685,27 @@ def prepare_dem(id_list, config, threads, epsg, spacing, buffer=None):
                 for tilename in tiles:
                     dem_tile = os.path.join(dem_dir, '{}_DEM.tif'.format(tilename))
                     dem_names_scene.append(dem_tile)
-                    if not os.path.isfile(dem_tile):
-                        with tile_ex.extract_tile(config['kml_file'], tilename) as tile:
-                            ext = tile.extent
-                            bounds = [ext['xmin'], ext['ymin'], ext['xmax'], ext['ymax']]
-                            dem_create(src=fname_dem_tmp, dst=dem_tile, t_srs=epsg, tr=(tr, tr),
-                                        geoid_convert=True, geoid=geoid, pbar=True,
-                                        outputBounds=bounds, threads=threads, nodata=-32767)
-                if os.path.isfile(fname_wbm_tmp):
-                    for tilename in tiles:
-                        wbm_tile = os.path.join(wbm_dir, '{}_WBM.tif'.format(tilename))
-                        if not os.path.isfile(wbm_tile):
-                            with tile_ex.extract_tile(config['kml_file'], tilename) as tile:
-                                ext = tile.extent
-                                bounds = [ext['xmin'], ext['ymin'], ext['xmax'], ext['ymax']]
-                                dem_create(src=fname_wbm_tmp, dst=wbm_tile, t_srs=epsg, tr=(tr, tr),
-                                        resampling_method='mode', pbar=True, outputBounds=bounds, threads=threads, nodata=-32767)
+                    if tilename in prepared:
+                        continue
+                    prepared.add(tilename)
+                    wbm_tile = os.path.join(wbm_dir, '{}_WBM.tif'.format(tilename))
+                    need_dem = not os.path.isfile(dem_tile)
+                    need_wbm = have_wbm and not os.path.isfile(wbm_tile)
+                    if not need_dem and not need_wbm:
+                        continue
+                    # extract the tile geometry once and reuse its bounds for both crops instead of
+                    # re-opening the tiling grid per target file
+                    with tile_ex.extract_tile(config['kml_file'], tilename) as tile:
+                        ext = tile.extent
+                    bounds = [ext['xmin'], ext['ymin'], ext['xmax'], ext['ymax']]
+                    if need_dem:
+                        dem_create(src=fname_dem_tmp, dst=dem_tile, t_srs=epsg, tr=(tr, tr),
+                                   geoid_convert=True, geoid=geoid, pbar=True,
+                                   outputBounds=bounds, threads=threads, nodata=-32767)
+                    if need_wbm:
+                        dem_create(src=fname_wbm_tmp, dst=wbm_tile, t_srs=epsg, tr=(tr, tr),
+                                   resampling_method='mode', pbar=True, outputBounds=bounds,
+                                   threads=threads, nodata=-32767)
             dem_names.append(dem_names_scene)
     boxes = None  # make sure all bounding box Vector objects are deleted
     
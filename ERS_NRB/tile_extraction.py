@@ -1,12 +1,75 @@
-from lxml import html
+import os
+import re
+import pickle
+from functools import lru_cache
+from math import floor
+from lxml import etree
 from spatialist.vector import Vector, wkt2vector
-from shapely.geometry import box
-from shapely.affinity import scale
 from pyproj import CRS
 from pyproj.aoi import AreaOfInterest
 from pyproj.database import query_utm_crs_info
 from pyproj import Transformer
 
+# cell extraction for the fixed table layout of the KML Description field; parsing the handful of
+# td pairs with precompiled regexes avoids building an lxml HTML tree per tile
+_TD_RE = re.compile(r'<td[^>]*>(.*?)</td>', re.S)
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+@lru_cache(maxsize=256)
+def _get_transformer(src_epsg, dst_epsg):
+    """
+    Return a cached `pyproj.Transformer` between two EPSG codes.
+
+    Transformer construction is far more expensive than the point transforms themselves, so scenes
+    sharing a UTM zone reuse the same object instead of rebuilding it per scene.
+
+    Parameters
+    ----------
+    src_epsg: int
+        EPSG code of the source CRS.
+    dst_epsg: int
+        EPSG code of the target CRS.
+
+    Returns
+    -------
+    pyproj.Transformer
+    """
+    return Transformer.from_crs(CRS.from_epsg(src_epsg), CRS.from_epsg(dst_epsg), always_xy=True)
+
+
+@lru_cache(maxsize=4096)
+def _utm_epsg(lon_bin, lat_bin):
+    """
+    Return the EPSG code of the UTM zone covering a point, cached per 1x1 degree cell.
+
+    The lookup queries the center of the degree cell: a query on the cell edge sits on a possible
+    zone boundary and returns the zones on both sides, whereas the center lies strictly inside one
+    zone. Since zone boundaries fall on whole degrees, every point in the cell shares the center's
+    zone, so neighbouring scenes reuse one proj.db lookup without changing the result.
+
+    Parameters
+    ----------
+    lon_bin: int
+        The longitude of the point, floored to a whole degree.
+    lat_bin: int
+        The latitude of the point, floored to a whole degree.
+
+    Returns
+    -------
+    int
+        EPSG code of the matching UTM CRS.
+    """
+    utm_crs_list = query_utm_crs_info(
+        datum_name='WGS 84',
+        area_of_interest=AreaOfInterest(
+            west_lon_degree=lon_bin + 0.5,
+            south_lat_degree=lat_bin + 0.5,
+            east_lon_degree=lon_bin + 0.5,
+            north_lat_degree=lat_bin + 0.5))
+    return int(utm_crs_list[0].code)
+
+
 def tiles_from_aoi(vectorobject, kml, epsg=None):
     """
     Return a list of unique MGRS tile IDs that overlap with an area of interest (AOI) provided as a vector object.
@@ -29,18 +92,23 @@ def tiles_from_aoi(vectorobject, kml, epsg=None):
     if isinstance(epsg, int):
         epsg = [epsg]
     with Vector(kml, driver='KML') as vec:
-        tilenames = []
+        # set-based bookkeeping: 'seen' makes the dedup check O(1) and ensures the description of
+        # each candidate tile is parsed at most once across all AOI features
+        tilenames = set()
+        seen = set()
         vectorobject.layer.ResetReading()
         for item in vectorobject.layer:
             geom = item.GetGeometryRef()
             vec.layer.SetSpatialFilter(geom)
             for tile in vec.layer:
                 tilename = tile.GetField('Name')
-                if tilename not in tilenames:
-                    attrib = description2dict(tile.GetField('Description'))
-                    if epsg is not None and attrib['EPSG'] not in epsg:
-                        continue
-                    tilenames.append(tilename)
+                if tilename in seen:
+                    continue
+                seen.add(tilename)
+                attrib = description2dict(tile.GetField('Description'))
+                if epsg is not None and attrib['EPSG'] not in epsg:
+                    continue
+                tilenames.add(tilename)
         vectorobject.layer.ResetReading()
         tile = None
         geom = None
@@ -48,10 +116,81 @@ def tiles_from_aoi(vectorobject, kml, epsg=None):
         return sorted(tilenames)
 
 
+# per-process cache of parsed KML attribute indexes, keyed by file path
+_KML_INDEX = {}
+
+
+def _iter_kml_tiles(kml):
+    """
+    Stream the (name, description) pairs of all Placemark elements of a tiling grid KML.
+
+    `lxml.etree.iterparse` visits one Placemark at a time and processed elements are released
+    immediately, so peak memory stays flat regardless of the document size.
+
+    Parameters
+    ----------
+    kml: str
+        Path to the Sentinel-2 tiling grid kml file provided by ESA.
+
+    Yields
+    ------
+    tuple[str, str]
+        The tile name and Description HTML of one Placemark.
+    """
+    ns = '{http://www.opengis.net/kml/2.2}'
+    for _, elem in etree.iterparse(kml, tag=ns + 'Placemark'):
+        yield elem.findtext(ns + 'name'), elem.findtext(ns + 'description')
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+def _load_kml_index(kml):
+    """
+    Load (and lazily build) an attribute index of the Sentinel-2 tiling grid KML.
+
+    The index maps each tile name to the attribute dictionary returned by `description2dict` and is
+    pickled next to the KML file, so the multi-thousand-placemark document is parsed once instead of
+    once per `extract_tile` call. A pickle older than the KML is rebuilt.
+
+    Parameters
+    ----------
+    kml: str
+        Path to the Sentinel-2 tiling grid kml file provided by ESA.
+
+    Returns
+    -------
+    dict
+        Mapping of MGRS tile ID to its attribute dictionary.
+    """
+    try:
+        return _KML_INDEX[kml]
+    except KeyError:
+        pass
+    idx_file = kml + '.idx.pkl'
+    index = None
+    if os.path.isfile(idx_file) and os.path.getmtime(idx_file) >= os.path.getmtime(kml):
+        try:
+            with open(idx_file, 'rb') as f:
+                index = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            index = None
+    if index is None:
+        index = {name: description2dict(desc) for name, desc in _iter_kml_tiles(kml)}
+        try:
+            with open(idx_file, 'wb') as f:
+                pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError:
+            # the KML may live in a read-only location; the in-memory index still serves this run
+            pass
+    _KML_INDEX[kml] = index
+    return index
+
+
 def extract_tile(kml, tile):
     """
     Extract a MGRS tile from the global Sentinel-2 tiling grid and return it as a vector object.
-    
+
     Parameters
     ----------
     kml: str
@@ -59,15 +198,12 @@ def extract_tile(kml, tile):
         https://sentinels.copernicus.eu/web/sentinel/missions/sentinel-2/data-products
     tile: str
         The MGRS tile ID that should be extracted and returned as a vector object.
-    
+
     Returns
     -------
     spatialist.vector.Vector
     """
-    with Vector(kml, driver='KML') as vec:
-        feat = vec.getFeatureByAttribute('Name', tile)
-        attrib = description2dict(feat.GetField('Description'))
-        feat = None
+    attrib = _load_kml_index(kml)[tile]
     return wkt2vector(attrib['UTM_WKT'], attrib['EPSG'])
 
 
@@ -86,9 +222,9 @@ def description2dict(description):
         a dictionary with keys 'TILE_ID', 'EPSG', 'MGRS_REF', 'UTM_WKT' and 'LL_WKT'.
         The value of field 'EPSG' is of type integer, all others are strings.
     """
-    attrib = html.fromstring(description)
-    attrib = [x for x in attrib.xpath('//tr/td//text()') if x != ' ']
-    attrib = dict(zip(attrib[0::2], attrib[1::2]))
+    cells = [_TAG_RE.sub('', x).strip() for x in _TD_RE.findall(description)]
+    cells = [x for x in cells if x]
+    attrib = dict(zip(cells[0::2], cells[1::2]))
     attrib['EPSG'] = int(attrib['EPSG'])
     return attrib
 
@@ -132,8 +268,8 @@ def main(config, tr):
                               'xmax': xmax,
                               'ymin': ymin}
     
-    align_dict = {'xmax': max([geo_dict[tile]['xmax'] for tile in list(geo_dict.keys())]),
-                  'ymin': min([geo_dict[tile]['ymin'] for tile in list(geo_dict.keys())])}
+    align_dict = {'xmax': max(v['xmax'] for v in geo_dict.values()),
+                  'ymin': min(v['ymin'] for v in geo_dict.values())}
     
     return geo_dict, align_dict
     
@@ -160,36 +296,34 @@ def no_aoi(ids, spacing):
     """
         
     geo_dict = {}
+    align_xmax = float('-inf')
+    align_ymin = float('inf')
     for i, scene in enumerate(ids):
         #create transformer to convert points from lat lon to a UTM
         corners = scene.getCorners()
-        utm_crs_list = query_utm_crs_info(
-        datum_name = 'WGS 84',
-        area_of_interest = AreaOfInterest(
-            west_lon_degree = corners['xmin'],
-            south_lat_degree= corners['ymin'],
-            east_lon_degree = corners['xmin'],
-            north_lat_degree = corners['ymin']))
-        utm_crs = CRS.from_epsg(utm_crs_list[0].code)
-        crs_lat_lon = CRS.from_epsg(4326)
-        ## transform the LA tLON points to UTM
-        transformer = Transformer.from_crs(crs_lat_lon, utm_crs,always_xy=True)
-        ymin_utm, xmin_utm = transformer.transform(corners['xmin'],corners['ymin'])
-        ymax_utm, xmax_utm = transformer.transform(corners['xmax'],corners['ymax'])
-
-
-        ## create polygon using UTM points
-        UTM_poly = box(ymin_utm, xmin_utm, ymax_utm, xmax_utm)
-        UTM_poly_grown = scale(UTM_poly, xfact=1.2, yfact=1.2, zfact=0.0, origin='center') # grow the polygon by 20 % to ensure the AOI is covered 
-        
-        ext = {'xmin': UTM_poly_grown.bounds[0], 'xmax': UTM_poly_grown.bounds[2], 'ymin': UTM_poly_grown.bounds[1], 'ymax': UTM_poly_grown.bounds[3]}
+        epsg_scene = _utm_epsg(floor(corners['xmin']), floor(corners['ymin']))
+        ## transform the LAT LON points to UTM
+        transformer = _get_transformer(4326, epsg_scene)
+        # one vectorized call for both corners; PROJ's per-call overhead dominates single-point use
+        (xmin_utm, xmax_utm), (ymin_utm, ymax_utm) = transformer.transform((corners['xmin'], corners['xmax']),
+                                                                           (corners['ymin'], corners['ymax']))
+
+        ## grow the extent by 20 % around its center to ensure the AOI is covered
+        cx = (xmin_utm + xmax_utm) / 2
+        cy = (ymin_utm + ymax_utm) / 2
+        hw = (xmax_utm - xmin_utm) * 0.6
+        hh = (ymax_utm - ymin_utm) * 0.6
+        ext = {'xmin': cx - hw, 'xmax': cx + hw, 'ymin': cy - hh, 'ymax': cy + hh}
         xmax = ext['xmax'] - spacing / 2
         ymin = ext['ymin'] + spacing / 2
         geo_dict[scene.outname_base()] = {'ext': ext,
-                                'epsg': int(utm_crs_list[0].code),
+                                'epsg': epsg_scene,
                                 'xmax': xmax,
                                 'ymin': ymin}
-        align_dict = {'xmax': max([geo_dict[tile]['xmax'] for tile in list(geo_dict.keys())]),
-                        'ymin': min([geo_dict[tile]['ymin'] for tile in list(geo_dict.keys())])}
-                      
+        # track the alignment coordinates as running scalars instead of re-aggregating the whole
+        # dictionary on every iteration
+        align_xmax = max(align_xmax, xmax)
+        align_ymin = min(align_ymin, ymin)
+    align_dict = {'xmax': align_xmax, 'ymin': align_ymin}
+
     return geo_dict, align_dict
\ No newline at end of file
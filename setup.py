@@ -1,4 +1,4 @@
-from setuptools import setup, find_packages
+from setuptools import setup
 import pathlib
 
 here = pathlib.Path(__file__).parent.resolve()
@@ -13,7 +13,7 @@ setup(
     url="https://github.com/SAR-ARD/ERS_NRB",
     author="John Truckenbrodt, Marco Wolsza, Ricardo Noguera",
     author_email="ricardo.noguera@telespazio.com",
-    packages=find_packages(where='.'),
+    packages=['ERS_NRB', 'ERS_NRB.metadata'],
     include_package_data=True,
     install_requires=['gdal>=3.4.1',
                       'click',